@@ -1,6 +1,46 @@
+import bisect
+import os
+import queue
+import selectors
 import threading
-import serial
-from decimal import Decimal, ROUND_HALF_UP
+import time
+
+# pyserial is imported by the first connect(), so importing this module (for
+# parsers, constants or tests) does not load the serial stack.
+serial = None
+
+
+def _load_serial():
+    global serial
+    if serial is None:
+        import serial as _serial
+        serial = _serial
+    return serial
+
+
+# Pre-encoded commands that carry no payload, passed straight to _execute().
+_CMD_TX1      = b"TX1;"
+_CMD_TX0      = b"TX0;"
+_CMD_FA_READ  = b"FA;"
+_CMD_SM0_READ = b"SM0;"
+_CMD_PC_READ  = b"PC;"
+_CMD_MD0_READ = b"MD0;"
+_CMD_MD_READ  = b"MD;"
+_CMD_RM6_READ = b"RM6;"
+
+_SEMI = b";"  # CAT command/reply terminator
+
+# Fixed reply lengths (terminator included) of the polled queries, so an
+# empty receive buffer is read as one whole reply rather than byte by byte.
+_RESP_LEN = {
+    _CMD_FA_READ:  12,  # FAnnnnnnnnn;
+    _CMD_SM0_READ: 7,   # SM0nnn;
+    _CMD_PC_READ:  6,   # PCnnn;
+    _CMD_MD0_READ: 5,   # MD0x;
+}
+
+# Linux ftdi_sio exposes its latency timer (ms) here, per tty name.
+_FTDI_LATENCY_SYSFS = "/sys/bus/usb-serial/devices/%s/latency_timer"
 
 
 class Yaesu991AControl:
@@ -9,21 +49,72 @@ class Yaesu991AControl:
 
     This module intentionally contains NO GUI code.
     """
-    def __init__(self, port="/dev/ttyUSB0", baud=38400, timeout=1, stopbits=1):
+    # MD0x mode codes accepted by set_mode().
+    _MODES = {"LSB": "1", "USB": "2", "CW": "3", "FM": "4", "AM": "5", "C4FM": "E"}
+    # Pre-encoded set commands, so set_mode() builds nothing per call.
+    _MODE_SET_CMDS = {m: b"MD0%s;" % c.encode("ascii") for m, c in _MODES.items()}
+
+    # MD reply code -> mode name reported by get_mode().
+    _CODE_TO_MODE = {
+        "1": "LSB", "2": "USB", "3": "CW-U", "4": "FM", "5": "AM",
+        "6": "RTTY-L", "7": "CW-L", "8": "DATA-L", "9": "RTTY-U",
+        "A": "DATA-FM", "C": "DATA-U", "E": "C4FM"
+    }
+
+    # CTCSS Tone Mapping (Index 001-050) - unused by GUI for now, but kept here.
+    # Tones are stored in integer tenths of a Hz (sorted) so tone_index() can
+    # bisect with exact integer comparisons instead of hashing floats.
+    _TONE_FREQS = (
+        670, 693, 719, 744, 770, 797, 825, 854, 885, 915,
+        1000, 1035, 1230, 1413, 1514,
+    )
+    _TONE_INDICES = (
+        "001", "002", "003", "004", "005", "006", "007", "008", "009", "010",
+        "013", "014", "019", "023", "025",
+    )
+    # Legacy float-keyed view of the same table.
+    tone_map = {f / 10: idx for f, idx in zip(_TONE_FREQS, _TONE_INDICES)}
+
+    def __init__(self, port="/dev/ttyUSB0", baud=38400, timeout=0.05, stopbits=1):
         self.port = port
         self.baud = baud
+        # Short read timeout: replies are a few bytes and _read_reply() polls
+        # to its own deadline, so a dropped reply must not block for seconds.
         self.timeout = timeout
         self.conn = None  # don't auto-connect on launch
-        self._io_lock = threading.Lock()
+        # All serial I/O runs on one worker thread fed by this queue, so CAT
+        # transactions from the GUI, poll, scan, and TX threads are naturally
+        # ordered without a lock around the port.  Items: (fn, reply_queue).
+        self._cmd_queue = queue.Queue()
+        self._io_thread = None
+        self._io_start_lock = threading.Lock()
+        # Bytes received after a ';' terminator are kept here for the next read.
+        self._rx_buf = bytearray()
+        # POSIX readiness selector on the port fd (None elsewhere / when
+        # disconnected); lets _read_reply wait exactly up to its deadline.
+        self._sel = None
         self._stopbits = float(stopbits)
         self._stopbits_serial = None  # resolved in connect(); also settable by GUI
 
-        # CTCSS Tone Mapping (Index 001-050) - unused by GUI for now, but kept here.
-        self.tone_map = {
-            67.0: "001", 69.3: "002", 71.9: "003", 74.4: "004", 77.0: "005",
-            79.7: "006", 82.5: "007", 85.4: "008", 88.5: "009", 91.5: "010",
-            100.0: "013", 103.5: "014", 123.0: "019", 141.3: "023", 151.4: "025"
-        }
+        # Short-lived cache of polled rig state, keyed by CAT query command:
+        # {cmd: (value, monotonic_ts)}.  See rig_set_cache().  Setters skip a
+        # write the fresh cache already shows, so a front-panel change made
+        # within the TTL can go unnoticed; user APPLYs pass force=True.
+        self._cache = {}
+        self._cache_ttl = 0.4
+
+        # Mode query form this firmware answers ("MD0" or "MD"); learned on
+        # the first successful get_mode() and forgotten on disconnect.
+        self._mode_query_cmd = None
+
+    @classmethod
+    def tone_index(cls, freq_hz):
+        """Return the CTCSS index string for *freq_hz* (e.g. 88.5 -> "009"), or None."""
+        key = int(round(float(freq_hz) * 10))
+        i = bisect.bisect_left(cls._TONE_FREQS, key)
+        if i < len(cls._TONE_FREQS) and cls._TONE_FREQS[i] == key:
+            return cls._TONE_INDICES[i]
+        return None
 
     def is_connected(self):
         return self.conn is not None and getattr(self.conn, "is_open", False)
@@ -33,6 +124,7 @@ class Yaesu991AControl:
         if self.is_connected():
             return True, None
         try:
+            serial = _load_serial()
             # Resolve stop bits: prefer the pre-mapped constant set by the GUI
             # (_stopbits_serial), fall back to converting the float _stopbits value.
             if self._stopbits_serial is not None:
@@ -49,15 +141,65 @@ class Yaesu991AControl:
                 port=self.port,
                 baudrate=self.baud,
                 timeout=self.timeout,
+                inter_byte_timeout=0.01,
+                write_timeout=0.1,
+                exclusive=True,
                 stopbits=sb,
             )
+            self._enable_low_latency()
+            self._cache.clear()
+            self._sel = self._make_selector()
+            self._start_io_worker()
             return True, None
         except Exception as e:
             self.conn = None
             return False, str(e)
 
+    def _make_selector(self):
+        """Return a read selector on the port fd, or None if the port has no fd."""
+        try:
+            sel = selectors.DefaultSelector()
+        except Exception:
+            return None
+        try:
+            sel.register(self.conn.fileno(), selectors.EVENT_READ)
+        except Exception:
+            sel.close()  # e.g. Windows: pyserial ports have no selectable fd
+            return None
+        return sel
+
+    def _enable_low_latency(self):
+        """
+        Ask the USB-serial driver to skip its latency timer (ASYNC_LOW_LATENCY).
+
+        FTDI-style adapters otherwise hold short CAT replies for up to 16 ms.
+        Only pyserial's POSIX backend offers this.  Where the driver refuses
+        the ioctl, the ftdi_sio sysfs latency timer is set to 1 ms instead
+        (usually root-only); failing both, the default behaviour stays.
+        """
+        set_low_latency = getattr(self.conn, "set_low_latency_mode", None)
+        if set_low_latency is None:
+            return
+        try:
+            set_low_latency(True)
+            return
+        except Exception:
+            pass
+        tty = os.path.basename(os.path.realpath(self.port or ""))
+        try:
+            with open(_FTDI_LATENCY_SYSFS % tty, "w") as fh:
+                fh.write("1")
+        except OSError:
+            pass
+
     def disconnect(self):
         """Close serial connection. Safe to call even if already disconnected."""
+        if self.conn is None:
+            return  # never opened (or already closed): nothing for the worker
+        # Close on the I/O worker so an in-flight transaction finishes first.
+        self._submit(self._close_port)
+
+    def _close_port(self):
         try:
             if self.conn is not None:
                 try:
@@ -66,112 +208,469 @@ class Yaesu991AControl:
                     self.conn = None
         except Exception:
             self.conn = None
+        if self._sel is not None:
+            self._sel.close()
+            self._sel = None
+        self._rx_buf.clear()
+        self._cache.clear()
+        self._mode_query_cmd = None
+
+    def rig_set_cache(self, timeout_ms, flag_on=True):
+        """
+        Configure the getter response cache.
+
+        Parameters
+        ----------
+        timeout_ms : int
+            How long a polled value stays fresh, in milliseconds.
+        flag_on : bool
+            False disables caching entirely (every getter hits the radio).
+        """
+        self._cache_ttl = max(0, int(timeout_ms)) / 1000.0 if flag_on else 0.0
+        self._cache.clear()
+
+    def _cache_get(self, cmd):
+        """Return the (value, ts) entry for *cmd* if still fresh, else None."""
+        entry = self._cache.get(cmd)
+        if entry is not None and time.monotonic() - entry[1] < self._cache_ttl:
+            return entry
+        return None
+
+    def _cache_put(self, cmd, value):
+        if self._cache_ttl > 0:
+            self._cache[cmd] = (value, time.monotonic())
+        return value
+
+    def _cache_evict(self, *cmds):
+        for cmd in cmds:
+            self._cache.pop(cmd, None)
+
+    # Per-reply read budget.  FT-991A replies arrive within a few ms at
+    # 38400 baud; together with the short port timeout a dropped reply costs
+    # the caller tens of milliseconds, not seconds.
+    _READ_DEADLINE_S = 0.05
+
+    def _start_io_worker(self):
+        """Start the serial I/O worker thread if it is not already running."""
+        with self._io_start_lock:
+            if self._io_thread is None or not self._io_thread.is_alive():
+                self._io_thread = threading.Thread(
+                    target=self._io_worker, name="cat-io", daemon=True
+                )
+                self._io_thread.start()
+
+    def _io_worker(self):
+        """Run queued serial jobs one at a time; the only thread touching the port."""
+        while True:
+            fn, reply_q = self._cmd_queue.get()
+            try:
+                result = fn()
+            except Exception as e:
+                print(f"Serial Error: {e}")
+                result = None
+            reply_q.put(result)
+
+    def _submit(self, fn):
+        """Run *fn* on the I/O worker and return its result (blocks the caller)."""
+        if threading.current_thread() is self._io_thread:
+            return fn()
+        self._start_io_worker()
+        reply_q = queue.SimpleQueue()
+        self._cmd_queue.put((fn, reply_q))
+        return reply_q.get()
 
     def _execute(self, cmd, read=False):
-        """Standard Yaesu ASCII CAT execution: send f'{cmd};' and optionally read until ';'."""
+        """
+        Standard Yaesu ASCII CAT execution: send f'{cmd};' and optionally read until ';'.
+
+        *cmd* may also be a complete pre-encoded ``bytes`` command (including
+        the ';'), which is written as-is.  Returns the reply when *read*,
+        True once a write-only command was written, and None when
+        disconnected or the port failed.
+        """
         if not self.is_connected():
             return None
 
+        data = cmd if isinstance(cmd, bytes) else cmd.encode("ascii") + b";"
+        return self._submit(lambda: self._transact(data, read))
+
+    def _discard_input(self):
+        """
+        I/O-worker only: drop anything still unread before a new command.
+
+        A reply that missed its deadline, or a ``?;`` answering a set
+        command, would otherwise be taken as the next command's reply.
+        """
+        self._rx_buf.clear()
+        self.conn.reset_input_buffer()
+
+    def _transact(self, data, read):
+        """I/O-worker only: write one command and optionally read its reply."""
+        if self.conn is None:  # a disconnect() queued ahead of us closed the port
+            return None
         try:
-            with self._io_lock:
-                self.conn.write(f"{cmd};".encode("ascii"))
-                if read:
-                    resp = self.conn.read_until(b";").decode(errors="replace")
-                    return resp.strip().replace(";", "")
+            self._discard_input()
+            self.conn.write(data)
+            if read:
+                # A read reply echoes its command (FA; -> FA...;, SM0; -> SM0...;).
+                prefix = data[:-1].decode("ascii")
+                return self._read_reply(_RESP_LEN.get(data, 0), prefix)
+            return True
         except Exception as e:
             # Keep this lightweight; GUI can surface errors if desired.
             print(f"Serial Error: {e}")
         return None
 
-    def set_frequency(self, mhz):
-        # Avoid float truncation errors (e.g. 13.9993 instead of 14.0000).
-        hz = int(
-            (Decimal(str(mhz)) * Decimal("1000000"))
-            .quantize(Decimal("1"), rounding=ROUND_HALF_UP)
-        )
-        self._execute(f"FA{hz:09d}")
+    def _read_reply(self, expect=0, prefix=None):
+        """
+        Drain the port into ``_rx_buf`` until a ';'-terminated reply is seen.
+
+        Reads everything already waiting in one call instead of byte-at-a-time
+        ``read_until``; when nothing is waiting yet, asks for the *expect*
+        bytes still missing (if known) so the reply arrives in one read.
+        With *prefix* (a str or tuple of str), replies not starting with it
+        (``?;``, a stray late answer) are discarded and reading continues.
+        Returns the reply without its terminator, or None if no matching
+        reply arrived before the deadline.  Any bytes following the
+        terminator stay buffered for the next reply.  I/O-worker only.
+        """
+        buf = self._rx_buf
+        sel = self._sel
+        deadline = None
+        start = 0
+        while True:
+            end = buf.find(_SEMI, start)
+            if end >= 0:
+                resp = buf[:end].decode("ascii", "replace").strip()
+                del buf[:end + 1]
+                if prefix is None or resp.startswith(prefix):
+                    return resp
+                start = 0
+                continue
 
-    def get_frequency(self):
-        resp = self._execute("FA", read=True)
+            if deadline is None:
+                deadline = time.monotonic() + self._READ_DEADLINE_S
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            # Where the fd is selectable, wait in select() for the rest of
+            # the budget rather than in a timed read().
+            if sel is not None and not self.conn.in_waiting and not sel.select(remaining):
+                continue
+            # Only the newly read bytes can hold the terminator.
+            start = len(buf)
+            buf += self.conn.read(self.conn.in_waiting or max(1, expect - len(buf)))
+
+    def query_batch(self, cmds):
+        """
+        Send several read commands in one write and collect the replies.
+
+        The FT-991A accepts concatenated commands (e.g. ``FA;SM0;PC;MD0;``)
+        and answers each in order, so N queries cost one serial turnaround
+        instead of N.
+
+        Parameters
+        ----------
+        cmds : iterable of str
+            Query commands, e.g. ``["FA", "PC"]``; a trailing ';' is
+            accepted and ignored.
+
+        Returns
+        -------
+        dict
+            Replies keyed by their 2-char command prefix (``"FA"``, ``"SM"``,
+            ``"PC"``, ``"MD"``...).  Missing or unanswered commands are absent.
+        """
+        cmds = list(cmds)
+        if not cmds or not self.is_connected():
+            return {}
+
+        prefixes = [c.rstrip(";") for c in cmds]
+        encoded = [f"{c};".encode("ascii") for c in prefixes]
+        data = b"".join(encoded)
+        expect = sum(_RESP_LEN.get(c, 0) for c in encoded)
+        return self._submit(lambda: self._transact_batch(data, prefixes, expect))
+
+    def poll_state(self, slow=True):
+        """
+        Read frequency and S-meter, plus RF power and mode when *slow*, in
+        one batched round-trip (``FA;SM0;PC;MD0;``).
+
+        Returns
+        -------
+        tuple
+            ``(freq_mhz, s_meter, rf_power, mode)``.  Fields not requested or
+            not answered are None.  Values read also refresh the cache.
+        """
+        cmds = ["FA", "SM0"]
+        if slow:
+            cmds += ["PC", self.mode_query_cmd]
+        replies = self.query_batch(cmds)
+
+        f = self.parse_frequency(replies.get("FA"))
+        s = self.parse_s_meter(replies.get("SM"))
+        p = m = None
+        if slow:
+            p = self.parse_rf_power(replies.get("PC"))
+            m = self.parse_mode(replies.get("MD"))
+            if m and self._mode_query_cmd is None:
+                self._mode_query_cmd = cmds[-1]
+
+        for key, value in (("FA", f), ("SM0", s), ("PC", p), ("MD0", m)):
+            if value is not None:
+                self._cache_put(key, value)
+        return f, s, p, m
+
+    def _transact_batch(self, data, prefixes, expect=0):
+        """
+        I/O-worker only: write a concatenated command and collect one reply
+        per entry of *prefixes* (the read commands in it, e.g. ``"SM0"``).
+        Replies matching none of the still-missing prefixes are discarded.
+        """
+        replies = {}
+        if self.conn is None:  # closed by a disconnect() queued ahead of us
+            return replies
+        pending = list(prefixes)
+        try:
+            self._discard_input()
+            self.conn.write(data)
+            while pending:
+                resp = self._read_reply(expect, tuple(pending))
+                if resp is None:
+                    break
+                pending.remove(next(p for p in pending if resp.startswith(p)))
+                replies[resp[:2]] = resp
+                expect = max(0, expect - len(resp) - 1)
+        except Exception as e:
+            print(f"Serial Error: {e}")
+        return replies
+
+    # -- Reply parsers shared by the getters and query_batch() callers --------
+    # Each returns None when the reply is missing or malformed.
+
+    @staticmethod
+    def _parse_trailing_int(resp, prefix, width):
+        """Return the *width* digits following *prefix* as an int, else None."""
+        if not resp or not resp.startswith(prefix):
+            return None
+        start = len(prefix)
+        digits = resp[start:start + width]
+        if len(digits) != width:
+            return None
+        try:
+            return int(digits)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def parse_frequency(resp):
+        """Parse ``FAnnnnnnnnn`` into MHz."""
         # Expected something like: "FA014250000"
         if not resp or not resp.startswith("FA") or len(resp) <= 2:
-            return 0.0
+            return None
         digits = resp[2:]
         if not digits.isdigit():
+            return None
+        return int(digits) / 1_000_000
+
+    @classmethod
+    def parse_mode(cls, resp):
+        """Parse ``MD0x`` (or ``MDx``) into a mode name."""
+        if resp and resp.startswith("MD") and len(resp) >= 4:
+            return cls._CODE_TO_MODE.get(resp[-1].upper())
+        return None
+
+    @classmethod
+    def parse_s_meter(cls, resp):
+        """Parse ``SM0xxx`` where xxx is 000-255."""
+        return cls._parse_trailing_int(resp, "SM0", 3)
+
+    @classmethod
+    def parse_rf_power(cls, resp):
+        """Parse ``PCxxx`` where xxx is typically 005-100."""
+        return cls._parse_trailing_int(resp, "PC", 3)
+
+    def set_frequency(self, mhz, force=False):
+        """
+        Send FAnnnnnnnnn.  Returns the frequency written, in integer Hz, or
+        None if the write failed.
+        """
+        # round(), not int(): avoids float truncation (e.g. 13.9993 instead of 14.0000).
+        return self.set_frequency_hz(round(float(mhz) * 1_000_000), force)
+
+    def set_frequency_hz(self, hz, force=False):
+        """
+        Send FAnnnnnnnnn for an integer frequency in Hz.  Returns *hz*, or
+        None if the write failed (disconnected or port error).
+
+        Skipped when the fresh cache (last poll or write) already shows *hz*,
+        unless *force* (an explicit user request) is set.
+        """
+        cached = None if force else self._cache_get("FA")
+        if cached is not None and round(cached[0] * 1_000_000) == hz:
+            return hz
+        written = self._execute(b"FA%09d;" % hz)
+        # The S-meter reading belonged to the old channel.
+        self._cache_evict("SM0")
+        if not written:
+            self._cache_evict("FA")
+            return None
+        self._cache_put("FA", hz / 1_000_000)
+        return hz
+
+    def set_mode_freq_verify(self, mode_str, mhz):
+        """
+        Set mode and VFO-A frequency and read the frequency back in one write
+        (``MD0x;FAnnnnnnnnn;FA;``).  The FA reply is the sync point, so no
+        settle sleeps are needed between the commands.
+
+        An unknown *mode_str* leaves the mode alone.  Returns the frequency
+        read back in MHz, or None if disconnected or the radio did not answer.
+        """
+        if not self.is_connected():
+            return None
+        hz = round(float(mhz) * 1_000_000)
+        mode_cmd = self._MODE_SET_CMDS.get((mode_str or "").strip().upper(), b"")
+        data = mode_cmd + b"FA%09d;" % hz + _CMD_FA_READ
+        replies = self._submit(
+            lambda: self._transact_batch(data, ["FA"], _RESP_LEN[_CMD_FA_READ])
+        )
+        self._cache_evict("MD0", "SM0", "FA")
+        actual = self.parse_frequency(replies.get("FA"))
+        if actual is not None:
+            self._cache_put("FA", actual)
+        return actual
+
+    def get_frequency(self, use_cache=True):
+        """
+        Read VFO-A frequency in MHz (0.0 on error).
+
+        Pass ``use_cache=False`` to force a CAT read, e.g. when verifying
+        that a set_frequency() actually took effect.
+        """
+        cached = self._cache_get("FA") if use_cache else None
+        if cached is not None:
+            return cached[0]
+        mhz = self.parse_frequency(self._execute(_CMD_FA_READ, read=True))
+        if mhz is None:
             return 0.0
-        return float(Decimal(digits) / Decimal("1000000"))
+        return self._cache_put("FA", mhz)
 
     def set_mode(self, mode_str):
-        modes = {"LSB": "1", "USB": "2", "CW": "3", "FM": "4", "AM": "5", "C4FM": "E"}
         mode_str = (mode_str or "").strip().upper()
-        if mode_str in modes:
-            self._execute(f"MD0{modes[mode_str]}")
+        cmd = self._MODE_SET_CMDS.get(mode_str)
+        if cmd is not None:
+            cached = self._cache_get("MD0")
+            if cached is not None and self._MODE_SET_CMDS.get(cached[0]) == cmd:
+                return  # already in this mode
+            self._execute(cmd)
+            self._cache_evict("MD0")
 
     def get_mode(self):
         """
         Read current mode using the Yaesu CAT 'MD' command.
         Returns currently active mode or None if unknown/unavailable.
         """
-        code_to_mode = {
-            "1": "LSB", "2": "USB", "3": "CW-U", "4": "FM", "5": "AM",
-            "6": "RTTY-L", "7": "CW-L", "8": "DATA-L", "9": "RTTY-U",
-            "A": "DATA-FM", "C": "DATA-U", "E": "C4FM"
-        }
+        cached = self._cache_get("MD0")
+        if cached is not None:
+            return cached[0]
 
-        resp = self._execute("MD0", read=True)
-        if not resp:
-            resp = self._execute("MD", read=True)
-        if not resp:
-            return None
+        if self._mode_query_cmd is not None:
+            mode = self.parse_mode(self._execute(self._mode_query_cmd, read=True))
+        else:
+            # Probe once: some firmware answers only one of the two forms.
+            mode = self.parse_mode(self._execute(_CMD_MD0_READ, read=True))
+            if mode:
+                self._mode_query_cmd = "MD0"
+            else:
+                mode = self.parse_mode(self._execute(_CMD_MD_READ, read=True))
+                if mode:
+                    self._mode_query_cmd = "MD"
 
-        if resp.startswith("MD") and len(resp) >= 4:
-            code = resp[-1].upper()
-            return code_to_mode.get(code)
+        if mode:
+            self._cache_put("MD0", mode)
+        return mode
 
-        return None
+    @property
+    def mode_query_cmd(self):
+        """Mode query command to use in query_batch(); "MD0" until probed."""
+        return self._mode_query_cmd or "MD0"
 
     def get_swr_meter(self):
-        resp = self._execute("RM6", read=True)
-        return int(resp[3:6]) if resp and len(resp) >= 6 and resp[3:6].isdigit() else 0
+        resp = self._execute(_CMD_RM6_READ, read=True)
+        v = self._parse_trailing_int(resp, "RM6", 3)
+        return v if v is not None else 0
 
-    def get_s_meter(self):
+    def get_s_meter(self, use_cache=True):
         """Query SM0, expect SM0xxx where xxx is 000-255."""
-        resp = self._execute("SM0", read=True)
-        if not resp:
+        cached = self._cache_get("SM0") if use_cache else None
+        if cached is not None:
+            return cached[0]
+        s = self.parse_s_meter(self._execute(_CMD_SM0_READ, read=True))
+        if s is None:
             return 0
-        if resp.startswith("SM") and len(resp) >= 6:
-            digits = resp[-3:]
-            if digits.isdigit():
-                return int(digits)
-        return 0
+        return self._cache_put("SM0", s)
+
+    def wait_for_smeter_stable(self, max_ms=80, tolerance=2, interval_s=0.01):
+        """
+        Poll SM0 after a retune until two consecutive readings agree within
+        *tolerance*, or *max_ms* elapses.  Returns the last reading.
+
+        Lets the scanner move on as soon as the meter has settled instead of
+        sleeping a fixed time per channel.  The first reading right after the
+        FA write can still be the old channel's, so it is discarded.
+        """
+        deadline = time.monotonic() + max_ms / 1000.0
+        self.get_s_meter(use_cache=False)
+        time.sleep(interval_s)
+        prev = self.get_s_meter(use_cache=False)
+        while time.monotonic() < deadline:
+            time.sleep(interval_s)
+            s = self.get_s_meter(use_cache=False)
+            if abs(s - prev) <= tolerance:
+                return s
+            prev = s
+        return prev
 
     def get_rf_power(self):
         """Query PC, expect PCxxx where xxx is typically 005-100."""
-        resp = self._execute("PC", read=True)
-        if not resp:
+        cached = self._cache_get("PC")
+        if cached is not None:
+            return cached[0]
+        p = self.parse_rf_power(self._execute(_CMD_PC_READ, read=True))
+        if p is None:
             return 0
-        if resp.startswith("PC") and len(resp) >= 5:
-            digits = resp[-3:]
-            if digits.isdigit():
-                return int(digits)
-        return 0
+        return self._cache_put("PC", p)
+
+    def set_rf_power(self, level, force=False):
+        """
+        Clamp 5..100 and send PCxxx.
 
-    def set_rf_power(self, level):
-        """Clamp 5..100 and send PCxxx."""
+        Returns the clamped level actually written, or None if *level* is
+        not a number or the write failed.  The radio applies the same clamp,
+        so callers can show the returned value without reading it back.
+        The write is skipped when the fresh cache already shows the level,
+        unless *force* (an explicit user APPLY) is set.
+        """
         try:
             level_int = int(level)
         except (TypeError, ValueError):
-            return False
+            return None
 
         level_int = max(5, min(100, level_int))
-        self._execute(f"PC{level_int:03d}")
-        return True
+        cached = None if force else self._cache_get("PC")
+        if cached is not None and cached[0] == level_int:
+            return level_int
+        if not self._execute(b"PC%03d;" % level_int):
+            self._cache_evict("PC")
+            return None
+        return self._cache_put("PC", level_int)
 
     def ptt_on(self):
-        self._execute("TX1")
+        self._execute(_CMD_TX1)
 
     def ptt_off(self):
-        self._execute("TX0")
+        self._execute(_CMD_TX0)
 
     # ------------------------------------------------------------------ #
     # AB – VFO-A TO VFO-B  (set only)
@@ -865,10 +1364,7 @@ class Yaesu991AControl:
         mhz : float
             Frequency in MHz (0.03–470 MHz).
         """
-        hz = int(
-            (Decimal(str(mhz)) * Decimal("1000000"))
-            .quantize(Decimal("1"), rounding=ROUND_HALF_UP)
-        )
+        hz = round(float(mhz) * 1_000_000)
         self._execute(f"FB{hz:09d}")
 
     def get_frequency_b(self):
@@ -886,7 +1382,7 @@ class Yaesu991AControl:
         digits = resp[2:]
         if not digits.isdigit():
             return 0.0
-        return float(Decimal(digits) / Decimal("1000000"))
+        return int(digits) / 1_000_000
 
     # ------------------------------------------------------------------ #
     # FS – FAST STEP
@@ -2217,6 +2713,14 @@ class Yaesu991AControl:
         self._execute(f"SC{mode}")
         return True
 
+    def start_scan_up(self):
+        """Start the radio's internal scan upward (SC1)."""
+        return self.set_scan(1)
+
+    def stop_scan(self):
+        """Stop the radio's internal scan (SC0)."""
+        return self.set_scan(0)
+
     def get_scan(self):
         """
         Read scan state.
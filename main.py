@@ -1,7 +1,6 @@
 #! /usr/bin/python3
 import logging
 import time
-import csv
 import configparser
 import os
 import threading
@@ -9,15 +8,17 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime, timezone
 import queue
+import collections
+import bisect
 
-try:
-    import serial.tools.list_ports as _list_ports
-    def _enum_serial_ports() -> list[str]:
-        """Return sorted list of available serial port names."""
-        return sorted(p.device for p in _list_ports.comports())
-except Exception:
-    def _enum_serial_ports() -> list[str]:  # type: ignore[misc]
+def _enum_serial_ports() -> list[str]:
+    """Return sorted list of available serial port names ([] without pyserial)."""
+    # Imported on demand (Settings dialog) rather than at module import.
+    try:
+        import serial.tools.list_ports as _list_ports
+    except Exception:
         return []
+    return sorted(p.device for p in _list_ports.comports())
 
 from ft991a_cat import Yaesu991AControl
 from digi_input import SoundCardAudioSource
@@ -46,6 +47,83 @@ BANDS = {
     '70cm': {'start': 430.000,'end': 440.000, 'step': 0.025, 'mode': 'FM'},
 }
 
+# (start, end, step, mode, name) per band in BANDS order, for lookups that
+# should not walk the nested dicts.
+_BAND_TABLE = tuple(
+    (p["start"], p["end"], p["step"], p["mode"], name) for name, p in BANDS.items()
+)
+
+# Non-overlapping (start, end, name) ranges sorted by start, with the starts
+# split out for bisect in RadioGUI.infer_band_from_freq().
+_BAND_RANGES = tuple(sorted((start, end, name) for start, end, _s, _m, name in _BAND_TABLE))
+_BAND_STARTS = tuple(r[0] for r in _BAND_RANGES)
+
+# Button states shared by the connect / scan toggles.
+_BTN_CONNECT    = {"text": "CONNECT",    "bg": "lightgreen"}
+_BTN_DISCONNECT = {"text": "DISCONNECT", "bg": "orange"}
+_BTN_SCAN_START = {"text": "START SCAN", "bg": "lightgray"}
+_BTN_SCAN_STOP  = {"text": "STOP SCAN",  "bg": "orange"}
+
+# Frequency text formats (MHz), bound once for the per-tick / per-hit paths.
+_FMT_FREQ_DISP = "{:09.4f}".format
+_FMT_FREQ_LOG  = "{:.4f}".format
+
+
+class _WakeQueue(queue.Queue):
+    """
+    Queue that calls ``on_wake()`` when an item lands in an empty queue.
+
+    ``on_wake`` runs on the producer's thread and must not block (TX-state
+    and audio callbacks put here).  The consumer drains everything per
+    wake, so one call covers a burst of puts.  A wake lost to a concurrent
+    drain is picked up by the consumer's fallback timer.
+
+    Once *maxlen* items are waiting (consumer stalled), ``(kind, ...)``
+    items whose kind is in *droppable* (a ``{kind: key}`` mapping) are
+    compacted to the newest item per key; kinds drawing the same widget
+    share a key.  Other items are never dropped and put() never blocks.
+    """
+
+    def __init__(self, maxlen=0, droppable=None):
+        super().__init__()
+        self.on_wake = None
+        self.maxlen = maxlen
+        self.droppable = droppable or {}
+        self._compact_at = maxlen
+
+    def _put(self, item):
+        q = self.queue
+        if not q:
+            self._compact_at = self.maxlen
+        elif self.maxlen and len(q) >= self._compact_at:
+            self._compact()
+            # If mostly ordered events remain, don't rescan on every put.
+            self._compact_at = len(q) + self.maxlen
+        q.append(item)
+
+    def _compact(self):
+        """Under self.mutex: drop droppable items superseded by a newer one."""
+        keys = self.droppable
+        seen = set()
+        kept = []
+        for old in reversed(self.queue):
+            key = keys.get(old[0])
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            kept.append(old)
+        self.queue.clear()
+        self.queue.extend(reversed(kept))
+
+    def put(self, item, block=True, timeout=None):
+        with self.mutex:
+            was_empty = not self.queue
+        super().put(item, block, timeout)
+        wake = self.on_wake
+        if was_empty and wake is not None:
+            wake()
+
 # Standard FT8 calling frequencies per band (MHz)
 FT8_FREQS = {
     '160m': 1.840,  '80m': 3.573,  '40m': 7.074,  '30m': 10.136,
@@ -59,6 +137,9 @@ FT8_LOG_PATH  = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ft8_me
 # ADIF contact log file (all modes — voice and digital)
 ADIF_LOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "qso_log.adi")
 
+# Legacy CSV log of scan hits / manual logs (relative to the working directory)
+RADIO_LOG_PATH = "radio_log.csv"
+
 # --- Persistent Configuration ---
 # Settings are stored in vader.cfg next to main.py.
 _CFG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vader.cfg")
@@ -776,16 +857,74 @@ class SettingsDialog:
 
 # --- GUI & Features Class ---
 class RadioGUI:
+    # Modes offered in the mode combobox; apply_mode() accepts only these.
+    _MODE_CHOICES = ("LSB", "USB", "CW", "FM", "AM", "C4FM", "DATA-L", "DATA-U")
+    _VALID_MODES  = frozenset(_MODE_CHOICES)
+
+    # Workers wake the Tk thread with _UI_WAKE_EVENT; process_ui_queue is
+    # then only a fallback every _UI_FALLBACK_MS, or a poll every
+    # _UI_POLL_MS where cross-thread event_generate is unavailable.  The
+    # kinds where only the newest value matters (readouts / status) are
+    # coalesced per drain, keyed by the widget they draw: kinds sharing a
+    # label share a key, so an RMS readout cannot bury a newer status.
+    _UI_WAKE_EVENT   = "<<UiQueue>>"
+    _UI_POLL_MS      = 16
+    _UI_FALLBACK_MS  = 250
+    _UI_IDLE_MAX_MS  = 200
+    _UI_QUEUE_MAX    = 256
+    _UI_COALESCE_KEYS = {
+        "freq": "freq", "s_meter": "s_meter", "rf_power": "rf_power",
+        "mode": "mode", "status": "status", "ptt_state": "ptt_state",
+        "audio_rms":          "audio_status",
+        "audio_status":       "audio_status",
+        "voice_audio_status": "voice_audio_status",
+        "voice_rx_rms":       "voice_audio_status",
+        "voice_tx_rms":       "voice_audio_status",
+    }
+
+    # log_box: at most one redraw per _LOG_FLUSH_MS; keep the last N lines.
+    _LOG_FLUSH_MS  = 250
+    _LOG_MAX_LINES = 500
+
     def __init__(self, root, radio, config: "AppConfig | None" = None):
         self.root   = root
         self.radio  = radio
         self._config = config or AppConfig()
         self.scanning    = False
+        # Set to wake scan_thread out of its settle/dwell waits on STOP SCAN;
+        # a fresh Event per scan so a late-exiting old thread cannot resume.
+        self._scan_stop  = threading.Event()
+        # Squelch threshold read by scan_thread each step; mirrored from
+        # squelch_var on the Tk thread so it can be changed mid-scan.
+        self._scan_thresh = 40
         self.active_band = None
 
-        self._ui_queue   = queue.Queue()
+        self._ui_queue   = _WakeQueue(self._UI_QUEUE_MAX, self._UI_COALESCE_KEYS)
+        # Set (non-blocking) by _ui_queue puts; _ui_wake_thread turns it into
+        # a Tk event.  _ui_wake_ok drops to False if that is unsupported.
+        self._ui_wake    = threading.Event()
+        self._ui_wake_ok = True
+        self._ui_idle_polls = 0   # consecutive empty process_ui_queue passes
         self._shutdown   = threading.Event()
         self._poll_thread = None
+        # Set by APPLY handlers so the poll thread re-reads mode/power on its
+        # next pass instead of waiting out the slow interval.
+        self._poll_slow_now = threading.Event()
+
+        # radio_log.csv rows go to a writer thread (started by the first
+        # log_to_file()) so neither the scan thread nor the Tk thread waits
+        # on disk I/O.  Items: row list, or None to flush and close.  The
+        # lock guards the writer start and the timestamp cache below.
+        self._log_q      = queue.Queue()
+        self._log_thread = None
+        self._log_lock   = threading.Lock()
+        self._last_ts_sec = 0
+        self._last_ts_str = ""
+
+        # Scan/QSO log lines waiting for the next log_box flush; coalesced so
+        # a busy scan costs one Text reflow per _LOG_FLUSH_MS, not one per hit.
+        self._log_pending = collections.deque(maxlen=self._LOG_MAX_LINES)
+        self._log_flush_scheduled = False
 
         # Operating mode: "voice" or "data"
         self._op_mode = "voice"
@@ -862,9 +1001,27 @@ class RadioGUI:
         # Last-known radio state (updated from poll thread via UI queue) — used
         # to pre-populate the voice QSO log form and FT8 contact records.
         self._current_freq:     float = 0.0
+        self._current_s_meter:  int   = 0
+        # Last frequency text / S-meter drawn; readouts that would draw the
+        # same thing skip Tk redraws.  (Mode and RF power are only queued on
+        # change by the poll thread.)
+        self._last_freq_txt = None
+        self._last_s    = None
+        # Last frequency / S-meter the poll thread queued; it only queues
+        # changes.  Cleared (any thread) to force the next sample through.
+        self._poll_last_f = None
+        self._poll_last_s = None
         self._current_mode:     str   = ""
         self._current_rf_power: int   = 0
 
+        # Keyboard focus on the power spinbox / mode combobox, tracked via
+        # <FocusIn>/<FocusOut> so polled values never overwrite user edits.
+        self._rf_power_focused: bool = False
+        self._mode_focused:     bool = False
+        # Mirrors the PTT button's enabled state (see _set_ptt_enabled) so
+        # _ptt_allowed() needs no Tcl round-trip per press/release.
+        self._ptt_enabled:      bool = True
+
         self.root.title("VaDER Command Center")
         self.root.geometry("550x950")
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -875,6 +1032,9 @@ class RadioGUI:
         # Apply initial operating mode (voice) to show/hide appropriate sections
         self._apply_op_mode("voice")
 
+        self.root.bind(self._UI_WAKE_EVENT, self._drain_ui_queue)
+        self._ui_queue.on_wake = self._ui_wake.set
+        threading.Thread(target=self._ui_wake_thread, name="ui-wake", daemon=True).start()
         self.process_ui_queue()
         self.start_polling()
 
@@ -1768,7 +1928,7 @@ class RadioGUI:
         self.settings_btn.pack(side=tk.RIGHT, padx=5, pady=5)
 
         self.conn_btn = tk.Button(
-            conn_frame, text="CONNECT", bg="lightgreen", command=self.toggle_connection
+            conn_frame, command=self.toggle_connection, **_BTN_CONNECT
         )
         self.conn_btn.pack(side=tk.RIGHT, padx=5, pady=5)
 
@@ -1789,8 +1949,10 @@ class RadioGUI:
             pwr_frame, from_=5, to=100, width=5, textvariable=self.rf_power_var
         )
         self.rf_power_spin.pack(side=tk.LEFT, padx=5)
-        self.rf_power_spin.bind("<Return>",   lambda e: self.apply_rf_power())
-        self.rf_power_spin.bind("<KP_Enter>", lambda e: self.apply_rf_power())
+        self.rf_power_spin.bind("<Return>",   self.apply_rf_power)
+        self.rf_power_spin.bind("<KP_Enter>", self.apply_rf_power)
+        self.rf_power_spin.bind("<FocusIn>",  lambda e: setattr(self, "_rf_power_focused", True))
+        self.rf_power_spin.bind("<FocusOut>", lambda e: setattr(self, "_rf_power_focused", False))
 
         self.rf_power_apply_btn = tk.Button(pwr_frame, text="APPLY", command=self.apply_rf_power)
         self.rf_power_apply_btn.pack(side=tk.LEFT, padx=5)
@@ -1808,7 +1970,7 @@ class RadioGUI:
         self.mode_combo = ttk.Combobox(
             mode_frame,
             textvariable=self.mode_var,
-            values=("LSB", "USB", "CW", "FM", "AM", "C4FM", "DATA-L", "DATA-U"),
+            values=self._MODE_CHOICES,
             state="readonly",
             width=9,
         )
@@ -1820,9 +1982,11 @@ class RadioGUI:
         self.mode_status = tk.Label(mode_frame, text="", anchor="w")
         self.mode_status.pack(side=tk.LEFT, padx=8, fill=tk.X, expand=True)
 
-        self.mode_combo.bind("<<ComboboxSelected>>", lambda e: self.apply_mode())
-        self.mode_combo.bind("<Return>",   lambda e: self.apply_mode())
-        self.mode_combo.bind("<KP_Enter>", lambda e: self.apply_mode())
+        self.mode_combo.bind("<<ComboboxSelected>>", self.apply_mode)
+        self.mode_combo.bind("<Return>",   self.apply_mode)
+        self.mode_combo.bind("<KP_Enter>", self.apply_mode)
+        self.mode_combo.bind("<FocusIn>",  lambda e: setattr(self, "_mode_focused", True))
+        self.mode_combo.bind("<FocusOut>", lambda e: setattr(self, "_mode_focused", False))
 
         # -- Band Selection ------------------------------------------------
         band_frame = tk.LabelFrame(self.root, text="Band Select")
@@ -1835,15 +1999,16 @@ class RadioGUI:
 
         _band_names = list(BANDS.keys())
         _mid = len(_band_names) // 2
+        goto = self.goto_band
         for b in _band_names[:_mid]:
             tk.Button(
                 band_row1, text=b, font=("Arial", 8),
-                command=lambda name=b: self.goto_band(name)
+                command=lambda name=b, g=goto: g(name)
             ).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=1)
         for b in _band_names[_mid:]:
             tk.Button(
                 band_row2, text=b, font=("Arial", 8),
-                command=lambda name=b: self.goto_band(name)
+                command=lambda name=b, g=goto: g(name)
             ).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=1)
 
         # FT8 shortcut
@@ -1858,14 +2023,19 @@ class RadioGUI:
         scan_frame = tk.LabelFrame(self.root, text="Scanner Controls")
         scan_frame.pack(padx=20, pady=6, fill=tk.X)
         self.scan_btn = tk.Button(
-            scan_frame, text="START SCAN", bg="lightgray", command=self.toggle_scan
+            scan_frame, command=self.toggle_scan, **_BTN_SCAN_START
         )
         self.scan_btn.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=5, pady=5)
 
         tk.Label(scan_frame, text="Squelch:").pack(side=tk.LEFT)
-        self.thresh_entry = tk.Entry(scan_frame, width=5)
-        self.thresh_entry.insert(0, "40")
+        self.squelch_var = tk.IntVar(value=self._scan_thresh)
+        self.thresh_entry = tk.Spinbox(
+            scan_frame, from_=0, to=255, width=5, textvariable=self.squelch_var,
+            validate="key",
+            validatecommand=(self.root.register(self._validate_squelch), "%P"),
+        )
         self.thresh_entry.pack(side=tk.LEFT, padx=5)
+        self.squelch_var.trace_add("write", self._on_squelch_change)
 
         # -- PTT (voice-only section) --------------------------------------
         self._ptt_frame = tk.Frame(self.root)
@@ -2139,11 +2309,16 @@ class RadioGUI:
 
     def refresh_connection_ui(self):
         connected = self.radio.is_connected()
+        # Callers may have written the readouts directly; repaint on next poll.
+        self._last_freq_txt = None
+        self._last_s        = None
+        self._poll_last_f = None
+        self._poll_last_s = None
         if connected:
             self.conn_status.config(
                 text=f"Status: CONNECTED ({self.radio.port} @ {self.radio.baud})"
             )
-            self.conn_btn.config(text="DISCONNECT", bg="orange")
+            self.conn_btn.config(**_BTN_DISCONNECT)
             self.rf_power_apply_btn.config(state=tk.NORMAL)
             self.rf_power_spin.config(state="normal")
             self.mode_apply_btn.config(state=tk.NORMAL)
@@ -2152,7 +2327,7 @@ class RadioGUI:
             self.conn_status.config(
                 text=f"Status: DISCONNECTED ({self.radio.port} @ {self.radio.baud})"
             )
-            self.conn_btn.config(text="CONNECT", bg="lightgreen")
+            self.conn_btn.config(**_BTN_CONNECT)
             self.meter_var.set(0)
             self.rf_power_var.set(0)
             self.rf_power_status.config(text="")
@@ -2164,12 +2339,12 @@ class RadioGUI:
 
     def _ptt_allowed(self) -> bool:
         """True when the GUI should allow PTT interaction."""
-        try:
-            if str(self.ptt_btn.cget("state")) == str(tk.DISABLED):
-                return False
-        except Exception:
-            pass
-        return self.radio.is_connected() and (not self.scanning)
+        return self._ptt_enabled and self.radio.is_connected() and (not self.scanning)
+
+    def _set_ptt_enabled(self, enabled: bool) -> None:
+        """UI-thread-only: enable/disable the PTT button and its mirror flag."""
+        self._ptt_enabled = bool(enabled)
+        self.ptt_btn.config(state=(tk.NORMAL if enabled else tk.DISABLED))
 
     def _on_ptt_press(self, event):
         if not self._ptt_allowed():
@@ -2189,8 +2364,10 @@ class RadioGUI:
 
     def on_close(self):
         """Save FT8 log, stop worker threads, and close serial cleanly before exiting."""
-        self.scanning = False
+        self._ui_queue.on_wake = None
+        self._stop_scan()
         self._shutdown.set()
+        self._ui_wake.set()  # release _ui_wake_thread so it sees _shutdown
 
         # Cancel any armed TX and cancel the countdown timer
         try:
@@ -2237,9 +2414,14 @@ class RadioGUI:
         except Exception:
             pass
 
+        try:
+            self._close_radio_log()
+        except Exception:
+            pass
+
         self.root.destroy()
 
-    def apply_rf_power(self):
+    def apply_rf_power(self, event=None):
         """Apply RF power from the GUI control via PC command."""
         if not self.radio.is_connected():
             self.rf_power_status.config(text="DISCONNECTED")
@@ -2251,136 +2433,214 @@ class RadioGUI:
             self.rf_power_status.config(text="INVALID")
             return
 
-        ok = self.radio.set_rf_power(desired)
-        if not ok:
+        # CAT write on a worker; the result comes back as "rf_power_set".
+        def _worker():
+            # set_rf_power() returns the clamped level it wrote; no readback needed.
+            actual = self.radio.set_rf_power(desired, force=True)
+            self._poll_slow_now.set()
+            self._ui_queue.put(("rf_power_set", actual))
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _apply_rf_power_result(self, actual):
+        """UI-thread-only: show the RF power level apply_rf_power() wrote (None: failed)."""
+        if actual is None:
             self.rf_power_status.config(text="INVALID")
             return
-
-        actual = self.radio.get_rf_power()
         self.rf_power_var.set(actual)
         self.rf_power_status.config(text=f"SET {actual:03d}")
 
-    def apply_mode(self):
+    def apply_mode(self, event=None):
         """Apply selected mode via CAT using set_mode()."""
         if not self.radio.is_connected():
             self.mode_status.config(text="DISCONNECTED")
             return
 
-        mode  = (self.mode_var.get() or "").strip().upper()
-        valid = {"LSB", "USB", "CW", "FM", "AM", "C4FM", "DATA-L", "DATA-U"}
-        if mode not in valid:
+        mode = (self.mode_var.get() or "").strip().upper()
+        if mode not in self._VALID_MODES:
             self.mode_status.config(text="INVALID")
             return
 
-        self.radio.set_mode(mode)
-        self.mode_status.config(text=f"SET {mode}")
+        def _worker():
+            self.radio.set_mode(mode)
+            self._poll_slow_now.set()
+            self._ui_queue.put(("mode_set", mode))
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _ui_wake_thread(self):
+        """
+        Forward _ui_wake to the Tk loop as _UI_WAKE_EVENT.
+
+        event_generate from a non-Tk thread blocks until Tk services it, so
+        only this thread makes that call; producers just set _ui_wake and
+        never wait on a busy UI (TX unkeying must not).
+        """
+        while True:
+            self._ui_wake.wait()
+            if self._shutdown.is_set():
+                return
+            self._ui_wake.clear()
+            try:
+                self.root.event_generate(self._UI_WAKE_EVENT, when="tail")
+            except Exception:
+                # Tcl built without threads (or Tk going away): stop waking
+                # and let process_ui_queue fall back to polling.
+                self._ui_queue.on_wake = None
+                self._ui_wake_ok = False
+                return
 
     def process_ui_queue(self):
-        """Drain UI events produced by worker threads (Tkinter-safe)."""
+        """
+        Timer drain behind the worker wakeups; reschedules itself.
+
+        Without wakeups, the poll interval doubles per empty pass from
+        _UI_POLL_MS up to _UI_IDLE_MAX_MS and snaps back on the next event.
+        """
+        if self._drain_ui_queue():
+            self._ui_idle_polls = 0
+        else:
+            self._ui_idle_polls += 1
+        if self._ui_wake_ok:
+            delay = self._UI_FALLBACK_MS
+        else:
+            delay = min(self._UI_IDLE_MAX_MS,
+                        self._UI_POLL_MS << min(self._ui_idle_polls, 4))
+        self.root.after(delay, self.process_ui_queue)
+
+    def _drain_ui_queue(self, _event=None):
+        """
+        Drain UI events produced by worker threads (Tkinter-safe).
+
+        Readout events (see _UI_COALESCE_KEYS) are coalesced so only the
+        newest event per widget touches it per pass; other events are
+        applied in order, after any readouts queued before them.  Returns
+        the number of events taken off the queue.
+        """
+        keys = self._UI_COALESCE_KEYS
+        latest = {}
+        n = 0
         try:
             while True:
                 item = self._ui_queue.get_nowait()
-                kind = item[0]
-
-                if kind == "freq":
-                    _, f = item
-                    self.freq_disp.config(text=f"{f:09.4f}")
-                    self._current_freq = f  # track for QSO log pre-fill
-
-                elif kind == "s_meter":
-                    _, s = item
-                    self.meter_var.set(s)
-
-                elif kind == "audio_rms":
-                    _, rms = item
-                    self.audio_status.config(text=f"Audio: LIVE (RMS {rms:.4f})")
-
-                elif kind == "audio_status":
-                    _, text = item
-                    self.audio_status.config(text=text)
-
-                elif kind == "voice_audio_status":
-                    _, text = item
-                    self.voice_audio_status.config(text=text)
-
-                elif kind == "voice_rx_rms":
-                    _, rms = item
-                    self.voice_audio_status.config(
-                        text=f"RX Monitor: LIVE  RMS {rms:.4f}"
-                    )
-
-                elif kind == "voice_tx_rms":
-                    _, rms = item
-                    self.voice_audio_status.config(
-                        text=f"TX ACTIVE  Mic RMS {rms:.4f}"
-                    )
-
-                elif kind == "rf_power":
-                    _, p = item
-                    self._current_rf_power = p  # track for QSO log pre-fill
-                    try:
-                        if str(self.root.focus_get()) != str(self.rf_power_spin):
-                            self.rf_power_var.set(p)
-                    except Exception:
-                        self.rf_power_var.set(p)
-
-                elif kind == "mode":
-                    _, m = item
-                    if m:
-                        self._current_mode = m  # track for QSO log pre-fill
-                    try:
-                        if str(self.root.focus_get()) != str(self.mode_combo):
-                            if m:
-                                self.mode_var.set(m)
-                    except Exception:
-                        if m:
-                            self.mode_var.set(m)
-
-                elif kind == "status":
-                    _, text = item
-                    self.conn_status.config(text=text)
-
-                elif kind == "ptt_state":
-                    _, enabled = item
-                    self.ptt_btn.config(state=(tk.NORMAL if enabled else tk.DISABLED))
-
-                elif kind == "log":
-                    _, freq, strength, notes, timestamp = item
-                    self.log_box.insert(
-                        tk.END,
-                        f"[{timestamp[-8:]}] {freq:.4f} S:{strength} | {notes}\n"
-                    )
-                    self.log_box.see(tk.END)
-
-                elif kind == "ft8_decoded":
-                    line = item[1]
-                    self.ft8_log.config(state=tk.NORMAL)
-                    self.ft8_log.insert(tk.END, line)
-                    self.ft8_log.see(tk.END)
-                    self.ft8_log.config(state=tk.DISABLED)
-                    # CQ QSO assist: route raw message + SNR to the prefill
-                    # watcher when a session is active.  Fields are present
-                    # when emitted by _on_ft8_decode (len == 4).
-                    if len(item) >= 4 and self._qso_assist_active:
-                        self._maybe_assist_prefill(item[2], item[3])
-
-                elif kind == "tx_state":
-                    _, state, message = item
-                    self._apply_tx_state_update(state, message)
-
-                elif kind == "qso_logged":
-                    # Notification that a QSO was successfully written to the log
-                    _, summary = item
-                    try:
-                        self.log_box.insert(tk.END, summary + "\n")
-                        self.log_box.see(tk.END)
-                    except Exception:
-                        pass
-
+                n += 1
+                key = keys.get(item[0])
+                if key is not None:
+                    latest[key] = item
+                    continue
+                if latest:
+                    for pending in latest.values():
+                        self._apply_ui_item(pending)
+                    latest.clear()
+                self._apply_ui_item(item)
         except queue.Empty:
             pass
 
-        self.root.after(50, self.process_ui_queue)
+        for pending in latest.values():
+            self._apply_ui_item(pending)
+        return n
+
+    def _apply_ui_item(self, item):
+        """UI-thread-only: apply one queued worker event to the widgets."""
+        kind = item[0]
+
+        if kind == "freq":
+            _, f = item
+            self._current_freq = f  # track for QSO log pre-fill
+            # Moves below the 100 Hz display resolution draw the same text.
+            text = _FMT_FREQ_DISP(f)
+            if text != self._last_freq_txt:
+                self._last_freq_txt = text
+                self.freq_disp.config(text=text)
+
+        elif kind == "s_meter":
+            _, s = item
+            self._current_s_meter = s  # for the voice QSO CSV row
+            if s != self._last_s:
+                self._last_s = s
+                self.meter_var.set(s)
+
+        elif kind == "audio_rms":
+            _, rms = item
+            self.audio_status.config(text=f"Audio: LIVE (RMS {rms:.4f})")
+
+        elif kind == "audio_status":
+            _, text = item
+            self.audio_status.config(text=text)
+
+        elif kind == "voice_audio_status":
+            _, text = item
+            self.voice_audio_status.config(text=text)
+
+        elif kind == "voice_rx_rms":
+            _, rms = item
+            self.voice_audio_status.config(
+                text=f"RX Monitor: LIVE  RMS {rms:.4f}"
+            )
+
+        elif kind == "voice_tx_rms":
+            _, rms = item
+            self.voice_audio_status.config(
+                text=f"TX ACTIVE  Mic RMS {rms:.4f}"
+            )
+
+        elif kind == "rf_power":
+            _, p = item
+            self._current_rf_power = p  # track for QSO log pre-fill
+            if not self._rf_power_focused:
+                self.rf_power_var.set(p)
+
+        elif kind == "mode":
+            _, m = item
+            if m:
+                self._current_mode = m  # track for QSO log pre-fill
+                if not self._mode_focused:
+                    self.mode_var.set(m)
+
+        elif kind == "status":
+            _, text = item
+            self.conn_status.config(text=text)
+
+        elif kind == "ptt_state":
+            _, enabled = item
+            self._set_ptt_enabled(enabled)
+
+        elif kind == "rf_power_set":
+            _, actual = item
+            self._apply_rf_power_result(actual)
+
+        elif kind == "mode_set":
+            _, m = item
+            self.mode_status.config(text=f"SET {m}")
+
+        elif kind == "connect_readback":
+            _, inferred, p, m = item
+            self._apply_connect_readback(inferred, p, m)
+
+        elif kind == "log":
+            _, freq_txt, strength, notes, timestamp = item
+            self._append_log_line(freq_txt, strength, notes, timestamp)
+
+        elif kind == "ft8_decoded":
+            line = item[1]
+            self.ft8_log.config(state=tk.NORMAL)
+            self.ft8_log.insert(tk.END, line)
+            self.ft8_log.see(tk.END)
+            self.ft8_log.config(state=tk.DISABLED)
+            # CQ QSO assist: route raw message + SNR to the prefill
+            # watcher when a session is active.  Fields are present
+            # when emitted by _on_ft8_decode (len == 4).
+            if len(item) >= 4 and self._qso_assist_active:
+                self._maybe_assist_prefill(item[2], item[3])
+
+        elif kind == "tx_state":
+            _, state, message = item
+            self._apply_tx_state_update(state, message)
+
+        elif kind == "qso_logged":
+            # Notification that a QSO was successfully written to the log
+            _, summary = item
+            self._queue_log_text(summary + "\n")
 
     def start_polling(self):
         """Start radio polling worker thread once (idempotent)."""
@@ -2389,10 +2649,31 @@ class RadioGUI:
         self._poll_thread = threading.Thread(target=self.radio_poll_thread, daemon=True)
         self._poll_thread.start()
 
-    def _append_log_line(self, freq, strength, notes, timestamp):
-        """UI-thread-only: update the log textbox."""
-        self.log_box.insert(tk.END, f"[{timestamp[-8:]}] {freq:.4f} S:{strength} | {notes}\n")
-        self.log_box.see(tk.END)
+    def _append_log_line(self, freq_txt, strength, notes, timestamp):
+        """UI-thread-only: queue a scan log line for the log textbox."""
+        self._queue_log_text(f"[{timestamp[-8:]}] {freq_txt} S:{strength} | {notes}\n")
+
+    def _queue_log_text(self, text):
+        """UI-thread-only: buffer *text* and schedule a single log_box flush."""
+        self._log_pending.append(text)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(self._LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self):
+        """UI-thread-only: write buffered lines in one insert and trim log_box."""
+        self._log_flush_scheduled = False
+        if not self._log_pending:
+            return
+        text = "".join(self._log_pending)
+        self._log_pending.clear()
+        try:
+            self.log_box.insert(tk.END, text)
+            # Text always keeps a trailing newline, hence the extra line.
+            self.log_box.delete("1.0", f"end-{self._LOG_MAX_LINES + 1}l")
+            self.log_box.see(tk.END)
+        except Exception:
+            pass  # widget destroyed during shutdown
 
     def radio_poll_thread(self):
         """
@@ -2404,11 +2685,13 @@ class RadioGUI:
         last_mode      = None
         last_pwr       = None
         last_status_ts = 0.0
-        last_s_ts      = 0.0
-        last_f_ts      = 0.0
-        last_slow_ts   = 0.0
+        next_fast      = 0.0
+        next_slow      = 0.0
+        timeout        = 0.0
 
-        while not self._shutdown.is_set():
+        # Sleep on the shutdown Event until the next read is due, so an idle
+        # connected rig costs ~5 wakes/s and close() never waits out a tick.
+        while not self._shutdown.wait(timeout):
             if not self.radio.is_connected():
                 now = time.monotonic()
                 if now - last_status_ts > 1.0:
@@ -2418,59 +2701,127 @@ class RadioGUI:
                     self._ui_queue.put(("rf_power", 0))
                     self._ui_queue.put(("mode", ""))
                     last_status_ts = now
-                time.sleep(0.2)
+                self._poll_last_f = None
+                self._poll_last_s = None
+                timeout = 0.2
                 continue
 
             # Connected
             if self.scanning:
-                time.sleep(0.1)
+                timeout = 0.1
                 continue
 
             now = time.monotonic()
 
-            # Frequency: moderately fast
-            if now - last_f_ts > 0.25:
-                f = self.radio.get_frequency()
-                self._ui_queue.put(("freq", f))
-                last_f_ts = now
+            # Frequency + S-meter every tick (what the operator watches);
+            # mode + power ride along in the same batched round-trip only
+            # every 2 s (they change on user action) or when APPLY asks.
+            if now >= next_fast:
+                slow = now >= next_slow or self._poll_slow_now.is_set()
+                if slow:
+                    self._poll_slow_now.clear()
+                f, s, p, m = self.radio.poll_state(slow=slow)
+                f = f if f is not None else 0.0
+                s = s if s is not None else 0
+                # A parked receiver repeats itself; only queue changes.
+                if f != self._poll_last_f:
+                    self._ui_queue.put(("freq", f))
+                    self._poll_last_f = f
+                if s != self._poll_last_s:
+                    self._ui_queue.put(("s_meter", s))
+                    self._poll_last_s = s
+                next_fast = now + 0.20
+
+                if slow:
+                    if m is None:
+                        m = self.radio.get_mode()  # firmware without MD0 form
+                    if p is None:
+                        p = self.radio.get_rf_power()
+
+                    if m != last_mode and m:
+                        self._ui_queue.put(("mode", m))
+                        last_mode = m
+
+                    if p != last_pwr:
+                        self._ui_queue.put(("rf_power", p))
+                        last_pwr = p
+
+                    next_slow = now + 2.0
+
+            # The slow read only ever rides a fast tick, so next_fast is
+            # always the nearest deadline.
+            timeout = max(0.0, next_fast - time.monotonic())
 
-            # S-meter: fast-ish
-            if now - last_s_ts > 0.20:
-                s = self.radio.get_s_meter()
-                self._ui_queue.put(("s_meter", s))
-                last_s_ts = now
+    def log_to_file(self, freq, strength, notes):
+        """Thread-safe logging: file write + enqueue UI update."""
+        sec = int(time.time())
+        with self._log_lock:
+            # Scan hits arrive in bursts; format each wall-clock second once.
+            if sec != self._last_ts_sec:
+                self._last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+                self._last_ts_sec = sec
+            timestamp = self._last_ts_str
+            if self._log_thread is None:
+                self._log_thread = threading.Thread(
+                    target=self._radio_log_writer, name="radio-log", daemon=True
+                )
+                self._log_thread.start()
+        # Format once; the CSV row and the log_box line share the text.
+        freq_txt = _FMT_FREQ_LOG(freq)
+        self._log_q.put([timestamp, freq_txt, strength, notes])
+        self._ui_queue.put(("log", freq_txt, strength, notes, timestamp))
 
-            # Mode + Power: slower (reduces CAT traffic)
-            if now - last_slow_ts > 1.5:
-                m = self.radio.get_mode()
-                p = self.radio.get_rf_power()
+    def _radio_log_writer(self, path=None):
+        """Writer thread: append queued rows, one write + flush per backlog."""
+        import csv  # only needed once something is logged
 
-                if m != last_mode and m:
-                    self._ui_queue.put(("mode", m))
-                    last_mode = m
+        if path is None:
+            path = RADIO_LOG_PATH
 
-                if p != last_pwr:
-                    self._ui_queue.put(("rf_power", p))
-                    last_pwr = p
+        # Sized so a whole queued burst reaches the OS as a single write().
+        try:
+            fh = open(path, "a", newline="", buffering=65536)
+        except OSError as e:
+            _log.warning("radio log disabled: cannot open %s: %s", path, e)
+            return
+        with fh:
+            writer = csv.writer(fh)
+            while True:
+                rows = [self._log_q.get()]
+                # Take the rest of a scan burst too, so it is written together.
+                try:
+                    while True:
+                        rows.append(self._log_q.get_nowait())
+                except queue.Empty:
+                    pass
+                stop = None in rows
+                if stop:
+                    del rows[rows.index(None):]
+                writer.writerows(rows)
+                fh.flush()
+                if stop:
+                    break
 
-                last_slow_ts = now
+    def _close_radio_log(self):
+        """Flush and close radio_log.csv if log_to_file() started the writer."""
+        with self._log_lock:
+            thread, self._log_thread = self._log_thread, None
+        if thread is not None:
+            self._log_q.put(None)
+            thread.join(timeout=2.0)
 
-            time.sleep(0.02)
+    def manual_log(self):
+        notes = self.note_entry.get()
 
-    def log_to_file(self, freq, strength, notes):
-        """Thread-safe logging: file write + enqueue UI update."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open("radio_log.csv", "a", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow([timestamp, f"{freq:.4f}", strength, notes])
-        self._ui_queue.put(("log", freq, strength, notes, timestamp))
+        # Read the rig on a worker; log_to_file() is thread-safe.
+        def _worker():
+            self.log_to_file(
+                self.radio.get_frequency(),
+                self.radio.get_s_meter(),
+                notes,
+            )
 
-    def manual_log(self):
-        self.log_to_file(
-            self.radio.get_frequency(),
-            self.radio.get_s_meter(),
-            self.note_entry.get(),
-        )
+        threading.Thread(target=_worker, daemon=True).start()
 
     def _on_log_voice_qso(self) -> None:
         """
@@ -2535,15 +2886,13 @@ class RadioGUI:
             f"RST:{rst_sent}/{rst_rcvd}"
         )
         print(summary, flush=True)
-        self.log_box.insert(tk.END, summary + "\n")
-        self.log_box.see(tk.END)
-        # Also append to legacy CSV for backward compatibility.  This may fail
-        # if the radio is disconnected (get_s_meter raises); that is acceptable
-        # — the ADIF record is already written above and is the authoritative log.
-        try:
-            self.log_to_file(freq, self.radio.get_s_meter(), f"QSO {dx_call}")
-        except Exception as exc:
-            print(f"[QSO Log] Legacy CSV write skipped: {exc}", flush=True)
+        # Same bounded path as scan hits; flushed now since the operator
+        # just clicked LOG.
+        self._queue_log_text(summary + "\n")
+        self._flush_log()
+        # Also append to legacy CSV for backward compatibility, with the last
+        # polled S-meter value: no CAT round-trip on the Tk thread.
+        self.log_to_file(freq, self._current_s_meter, f"QSO {dx_call}")
         # Clear form fields for next QSO
         self._qso_dx_call_var.set("")
         self._qso_dx_grid_var.set("")
@@ -2553,18 +2902,18 @@ class RadioGUI:
 
     def infer_band_from_freq(self, mhz: float):
         """Return band name if mhz is inside a defined band plan, else None."""
-        for name, plan in BANDS.items():
-            if plan["start"] <= mhz <= plan["end"]:
-                return name
+        i = bisect.bisect_right(_BAND_STARTS, mhz) - 1
+        if i >= 0 and mhz <= _BAND_RANGES[i][1]:
+            return _BAND_RANGES[i][2]
         return None
 
     def _goto_ft8_freq(self) -> None:
         """Jump to the FT8 calling frequency for the currently active band."""
         band = self.active_band
         if not band:
+            # Last polled VFO (no CAT round-trip on the Tk thread).
             if self.radio.is_connected():
-                f    = self.radio.get_frequency()
-                band = self.infer_band_from_freq(f)
+                band = self.infer_band_from_freq(self._current_freq)
         if not band or band not in FT8_FREQS:
             self.conn_status.config(
                 text="Status: select a band before jumping to FT8 frequency"
@@ -2574,7 +2923,7 @@ class RadioGUI:
         def _worker():
             self.radio.set_mode("USB")
             time.sleep(0.05)
-            self.radio.set_frequency(freq)
+            self.radio.set_frequency(freq, force=True)
             self._ui_queue.put(("mode", "USB"))
             self._ui_queue.put(("status", f"Status: FT8 {band} {freq:.3f} MHz"))
         if self.radio.is_connected():
@@ -2582,11 +2931,14 @@ class RadioGUI:
 
     def goto_band(self, band_name: str):
         """Set radio to band start + mode, and make it the active scan band."""
-        if band_name not in BANDS:
+        plan = BANDS.get(band_name)
+        if plan is None:
             return
 
         self.active_band = band_name
-        plan = BANDS[band_name]
+        target = float(plan["start"])
+        mode   = plan["mode"]
+        step   = plan["step"]
 
         if not self.radio.is_connected():
             self.conn_status.config(
@@ -2596,25 +2948,16 @@ class RadioGUI:
 
         def worker():
             try:
-                target = float(plan["start"])
-                mode   = plan["mode"]
+                # Mode first (some rigs behave better this way), then the
+                # frequency and its read-back, all in one CAT write.
+                actual = self.radio.set_mode_freq_verify(mode, target)
 
-                # 1) Mode first (some rigs behave better this way)
-                self.radio.set_mode(mode)
-                time.sleep(0.05)
-
-                # 2) Set frequency
-                self.radio.set_frequency(target)
-                time.sleep(0.05)
-
-                # 3) Verify; if we are off by > ~50 Hz, retry once
-                actual = self.radio.get_frequency()
-                if abs(actual - target) > 0.00005:
+                # Off by > ~50 Hz (or no answer): retry the frequency once
+                if actual is None or abs(actual - target) > 0.00005:
                     self.radio.set_frequency(target)
-                    time.sleep(0.05)
 
                 # Update step size to match band default
-                self._freq_step = plan["step"]
+                self._freq_step = step
                 self._ui_queue.put(("mode", mode))
                 self._ui_queue.put(
                     ("status", f"Status: CONNECTED ({self.radio.port} @ {self.radio.baud}) [{band_name}]")
@@ -2624,46 +2967,62 @@ class RadioGUI:
 
         threading.Thread(target=worker, daemon=True).start()
 
-        self.mode_var.set(plan["mode"])
-        self.mode_status.config(text=f"SET {plan['mode']} ({band_name})")
+        self.mode_var.set(mode)
+        self.mode_status.config(text=f"SET {mode} ({band_name})")
 
     def toggle_scan(self):
         if not self.scanning:
             if not self.radio.is_connected():
                 self._ui_queue.put(("status", "Status: DISCONNECTED (click CONNECT to scan)"))
-                self.scan_btn.config(text="START SCAN", bg="lightgray")
+                self.scan_btn.config(**_BTN_SCAN_START)
                 self.scanning = False
                 return
 
             if not self.active_band:
-                current_f = self.radio.get_frequency()
-                self.active_band = self.infer_band_from_freq(current_f)
+                # Last polled VFO (no CAT round-trip on the Tk thread).
+                self.active_band = self.infer_band_from_freq(self._current_freq)
 
             if not self.active_band:
                 self._ui_queue.put(("status", "Status: ERROR (Select a band before scanning)"))
-                self.scan_btn.config(text="START SCAN", bg="lightgray")
+                self.scan_btn.config(**_BTN_SCAN_START)
                 self.scanning = False
                 return
 
-            try:
-                thresh = int(self.thresh_entry.get())
-            except (TypeError, ValueError):
-                thresh = 40
-                self._ui_queue.put(("status", "Status: SCAN (invalid squelch; default 40)"))
-
             self._ui_queue.put(("ptt_state", False))
 
+            self._scan_stop = threading.Event()
             self.scanning = True
-            self.scan_btn.config(text="STOP SCAN", bg="orange")
+            self.scan_btn.config(**_BTN_SCAN_STOP)
 
             band = self.active_band
-            threading.Thread(target=self.scan_thread, args=(band, thresh), daemon=True).start()
+            threading.Thread(
+                target=self.scan_thread, args=(band, self._scan_stop), daemon=True
+            ).start()
         else:
-            self.scanning = False
-            self.scan_btn.config(text="START SCAN", bg="lightgray")
+            self._stop_scan()
+            self.scan_btn.config(**_BTN_SCAN_START)
             self._ui_queue.put(("ptt_state", True))
 
-    def scan_thread(self, band: str, thresh: int):
+    @staticmethod
+    def _validate_squelch(proposed: str) -> bool:
+        """Spinbox key validator: allow empty (mid-edit) or 0-255."""
+        return proposed == "" or (proposed.isdigit() and int(proposed) <= 255)
+
+    def _on_squelch_change(self, *_):
+        """Tk-thread: publish a new squelch value to the scan thread."""
+        try:
+            self._scan_thresh = int(self.squelch_var.get())
+        except Exception:
+            pass  # empty field while typing; keep the previous threshold
+
+    def _stop_scan(self):
+        """Stop scanning and wake scan_thread immediately if it is waiting."""
+        self.scanning = False
+        self._scan_stop.set()
+
+    def scan_thread(self, band: str, stop: threading.Event | None = None):
+        if stop is None:
+            stop = self._scan_stop
         plan = BANDS.get(band)
         if not plan:
             self.scanning = False
@@ -2671,43 +3030,68 @@ class RadioGUI:
             self._ui_queue.put(("status", "Status: ERROR (No band selected / unknown band plan)"))
             return
 
-        start = float(plan["start"])
-        end   = float(plan["end"])
-        step  = float(plan["step"])
+        # Integer-Hz channel grid: no float drift over long scans.
+        start_hz = round(float(plan["start"]) * 1_000_000)
+        end_hz   = round(float(plan["end"]) * 1_000_000)
+        step_hz  = round(float(plan["step"]) * 1_000_000)
 
-        if step <= 0:
+        if step_hz <= 0 or end_hz < start_hz:
             self.scanning = False
             self._ui_queue.put(("ptt_state", True))
             self._ui_queue.put(("status", f"Status: ERROR (Invalid step for {band})"))
             return
 
-        curr_f = self.radio.get_frequency()
-        if curr_f < start or curr_f > end:
-            curr_f = start
-
-        while self.scanning and not self._shutdown.is_set():
-            if not self.radio.is_connected():
+        # A range indexes in O(1) without materialising the channel list.
+        steps_hz = range(start_hz, end_hz + 1, step_hz)
+
+        # Resume from the first channel at or above the current VFO (ceiling
+        # division on the uniform grid).
+        cur_hz = round(self.radio.get_frequency() * 1_000_000)
+        idx = -((start_hz - cur_hz) // step_hz) if start_hz <= cur_hz <= end_hz else 0
+        if idx >= len(steps_hz):
+            idx = 0
+
+        # Hot loop: bind the per-step calls once.
+        radio        = self.radio
+        is_connected = radio.is_connected
+        set_freq_hz  = radio.set_frequency_hz
+        wait_stable  = radio.wait_for_smeter_stable
+        get_s        = radio.get_s_meter
+        n_steps      = len(steps_hz)
+        last_tuned_hz = None
+
+        # The per-scan stop Event is the only exit signal (_stop_scan sets it
+        # alongside self.scanning, which remains UI/poll state).
+        while not stop.is_set() and not self._shutdown.is_set():
+            if not is_connected():
                 self._ui_queue.put(("status", "Status: DISCONNECTED (scan stopped)"))
                 break
 
-            if curr_f < start or curr_f > end:
-                curr_f = start
-
-            self.radio.set_frequency(curr_f)
-            time.sleep(0.15)
+            hz = steps_hz[idx]
+            if hz != last_tuned_hz:  # e.g. a one-channel plan: tune once
+                set_freq_hz(hz)
+                last_tuned_hz = hz
 
-            s = self.radio.get_s_meter()
-            if s >= thresh:
-                self.log_to_file(curr_f, s, f"AUTO-FOUND ({band})")
-
-                dwell_until = time.monotonic() + 3.0
-                while self.scanning and not self._shutdown.is_set() and time.monotonic() < dwell_until:
-                    time.sleep(0.05)
+            # Move on as soon as the meter settles rather than a fixed sleep.
+            s = wait_stable(max_ms=80)
+            if stop.is_set():
+                break
+            if s >= self._scan_thresh:
+                self.log_to_file(hz / 1_000_000, s, f"AUTO-FOUND ({band})")
+
+                # Hold the channel while the signal stays up (2-count hysteresis).
+                while not stop.wait(0.1):
+                    if get_s(use_cache=False) < self._scan_thresh - 2:
+                        break
+                if stop.is_set():
+                    break
 
-            curr_f += step
+            idx = (idx + 1) % n_steps
 
-        self.scanning = False
-        self._ui_queue.put(("ptt_state", True))
+        # A newer scan may already own the flags if STOP/START was quick.
+        if stop is self._scan_stop:
+            self.scanning = False
+            self._ui_queue.put(("ptt_state", True))
 
     def open_settings(self) -> None:
         """Open the settings modal dialog (serial port + audio devices)."""
@@ -2759,7 +3143,7 @@ class RadioGUI:
         was_connected = self.radio.is_connected()
 
         if was_connected:
-            self.scanning = False
+            self._stop_scan()
             self.radio.disconnect()
 
         # Update serial parameters
@@ -2829,9 +3213,9 @@ class RadioGUI:
     def toggle_connection(self):
         if self.radio.is_connected():
             # Stop scanning before disconnecting
-            self.scanning = False
-            self.scan_btn.config(text="START SCAN", bg="lightgray")
-            self.ptt_btn.config(state=tk.NORMAL)
+            self._stop_scan()
+            self.scan_btn.config(**_BTN_SCAN_START)
+            self._set_ptt_enabled(True)
 
             self.radio.disconnect()
             self.freq_disp.config(text="DISCONNECTED")
@@ -2856,19 +3240,31 @@ class RadioGUI:
         # Ensure polling restarts after a successful connect
         self.start_polling()
 
-        # Infer active band on connect if possible
-        f = self.radio.get_frequency()
-        inferred = self.infer_band_from_freq(f)
+        # Initial rig readback runs off the Tk thread so the window keeps
+        # repainting while the CAT round-trips complete.
+        threading.Thread(target=self._connect_readback_worker, daemon=True).start()
+
+    def _connect_readback_worker(self):
+        """Read frequency/power/mode after connect and post them to the UI queue."""
+        try:
+            f = self.radio.get_frequency()
+            p = self.radio.get_rf_power()
+            m = self.radio.get_mode()
+        except Exception as e:
+            self._ui_queue.put(("status", f"Status: ERROR (initial read failed: {e})"))
+            return
+        self._ui_queue.put(("connect_readback", self.infer_band_from_freq(f), p, m))
+
+    def _apply_connect_readback(self, inferred, p, m):
+        """UI-thread-only: show the rig state read right after connecting."""
         if inferred:
             self.active_band = inferred
             self.conn_status.config(
                 text=f"Status: CONNECTED ({self.radio.port} @ {self.radio.baud}) [{inferred}]"
             )
 
-        p = self.radio.get_rf_power()
         self.rf_power_var.set(p)
         self.rf_power_status.config(text=f"READ {p:03d}")
-        m = self.radio.get_mode()
         if m:
             self.mode_var.set(m)
             self.mode_status.config(text=f"READ {m}")
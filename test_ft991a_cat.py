@@ -13,7 +13,7 @@ import io
 import sys
 import types
 import unittest
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import MagicMock, mock_open, patch, call
 
 # ---------------------------------------------------------------------------
 # Minimal serial stub so the import does not require pyserial to be installed
@@ -47,8 +47,10 @@ def _last_write(ctrl) -> str:
 
 
 def _set_response(ctrl, text: str):
-    """Prime the mock to return *text* (without the trailing ;) on read_until."""
-    ctrl.conn.read_until.return_value = f"{text};".encode("ascii")
+    """Prime the mock to return *text* (without the trailing ;) on read."""
+    data = f"{text};".encode("ascii")
+    ctrl.conn.in_waiting = len(data)
+    ctrl.conn.read.return_value = data
 
 
 # ===========================================================================
@@ -73,6 +75,14 @@ class TestExistingCommands(unittest.TestCase):
             sys.stdout = _orig
         self.assertEqual(buf.getvalue(), "", "set_frequency must not print to stdout")
 
+    def test_set_frequency_rounds_float_error(self):
+        """7.074 * 1e6 is 7073999.999... in binary float; must still send 7074000."""
+        ctrl = _make_ctrl()
+        for mhz, expected in ((7.074, "FA007074000"), (144.174, "FA144174000"),
+                              (10.136, "FA010136000"), (0.03, "FA000030000")):
+            ctrl.set_frequency(mhz)
+            self.assertEqual(_last_write(ctrl), expected)
+
     def test_get_frequency(self):
         ctrl = _make_ctrl()
         _set_response(ctrl, "FA014250000")
@@ -93,6 +103,45 @@ class TestExistingCommands(unittest.TestCase):
         _set_response(ctrl, "MD02")
         self.assertEqual(ctrl.get_mode(), "USB")
 
+    def test_get_mode_learns_md_only_firmware(self):
+        ctrl = _make_ctrl()
+        ctrl.rig_set_cache(0, False)
+        ctrl.conn.in_waiting = 0
+        # MD0 goes unanswered (deadline), MD answers.
+        ctrl.conn.read.side_effect = lambda n: (
+            b"MD02;" if ctrl.conn.write.call_args[0][0] == b"MD;" else b"")
+        self.assertEqual(ctrl.get_mode(), "USB")
+        self.assertEqual(ctrl.mode_query_cmd, "MD")
+        ctrl.conn.write.reset_mock()
+        self.assertEqual(ctrl.get_mode(), "USB")
+        ctrl.conn.write.assert_called_once_with(b"MD;")
+
+    def test_get_mode_probe_reset_on_disconnect(self):
+        ctrl = _make_ctrl()
+        _set_response(ctrl, "MD02")
+        ctrl.get_mode()
+        self.assertEqual(ctrl._mode_query_cmd, "MD0")
+        ctrl.disconnect()
+        self.assertIsNone(ctrl._mode_query_cmd)
+
+    def test_set_mode_unknown_sends_nothing(self):
+        ctrl = _make_ctrl()
+        ctrl.set_mode("DATA-U")
+        ctrl.conn.write.assert_not_called()
+
+    def test_tone_map_shared_class_constant(self):
+        self.assertIs(Yaesu991AControl().tone_map, Yaesu991AControl.tone_map)
+        self.assertEqual(Yaesu991AControl.tone_map[88.5], "009")
+
+    def test_tone_index_lookup(self):
+        from decimal import Decimal
+        self.assertEqual(Yaesu991AControl.tone_index(67.0), "001")
+        self.assertEqual(Yaesu991AControl.tone_index(Decimal("88.5")), "009")
+        self.assertEqual(Yaesu991AControl.tone_index(151.40001), "025")
+        self.assertIsNone(Yaesu991AControl.tone_index(60.0))
+        self.assertIsNone(Yaesu991AControl.tone_index(95.0))
+        self.assertIsNone(Yaesu991AControl.tone_index(200.0))
+
     def test_set_rf_power_clamp(self):
         ctrl = _make_ctrl()
         ctrl.set_rf_power(200)
@@ -103,6 +152,27 @@ class TestExistingCommands(unittest.TestCase):
         ctrl.set_rf_power(1)
         self.assertEqual(_last_write(ctrl), "PC005")
 
+    def test_set_rf_power_returns_clamped_level(self):
+        ctrl = _make_ctrl()
+        self.assertEqual(ctrl.set_rf_power(200), 100)
+        self.assertEqual(ctrl.set_rf_power("50"), 50)
+        self.assertIsNone(ctrl.set_rf_power("abc"))
+
+    def test_failed_set_rf_power_returns_none(self):
+        ctrl = _make_ctrl()
+        ctrl.conn.write.side_effect = OSError("unplugged")
+        with patch("sys.stdout", io.StringIO()):
+            self.assertIsNone(ctrl.set_rf_power(50))
+        self.assertIsNone(Yaesu991AControl().set_rf_power(50))   # disconnected
+
+    def test_failed_set_frequency_returns_none(self):
+        ctrl = _make_ctrl()
+        ctrl.conn.write.side_effect = OSError("unplugged")
+        with patch("sys.stdout", io.StringIO()):
+            self.assertIsNone(ctrl.set_frequency_hz(14_074_000))
+            self.assertIsNone(ctrl.set_frequency(14.074))
+        self.assertIsNone(Yaesu991AControl().set_frequency(14.074))   # disconnected
+
     def test_ptt_on(self):
         ctrl = _make_ctrl()
         ctrl.ptt_on()
@@ -113,6 +183,466 @@ class TestExistingCommands(unittest.TestCase):
         ctrl.ptt_off()
         self.assertEqual(_last_write(ctrl), "TX0")
 
+    def test_execute_writes_bytes_command_verbatim(self):
+        ctrl = _make_ctrl()
+        ctrl._execute(b"TX1;")
+        ctrl.conn.write.assert_called_once_with(b"TX1;")
+
+    def test_execute_appends_terminator_to_str_command(self):
+        ctrl = _make_ctrl()
+        ctrl._execute("AC001")
+        ctrl.conn.write.assert_called_once_with(b"AC001;")
+
+
+# ===========================================================================
+# Reply framing – non-blocking drain of the serial port
+# ===========================================================================
+
+class TestReadReply(unittest.TestCase):
+
+    def test_reply_split_across_reads(self):
+        ctrl = _make_ctrl()
+        ctrl.conn.in_waiting = 0
+        ctrl.conn.read.side_effect = [b"FA0142", b"50000;"]
+        self.assertAlmostEqual(ctrl.get_frequency(), 14.25)
+
+    def test_known_reply_length_read_in_one_call(self):
+        ctrl = _make_ctrl()
+        ctrl.conn.in_waiting = 0
+        ctrl.conn.read.side_effect = [b"FA014250000;"]
+        self.assertAlmostEqual(ctrl.get_frequency(), 14.25)
+        ctrl.conn.read.assert_called_once_with(12)
+
+    def test_batch_requests_total_expected_length(self):
+        ctrl = _make_ctrl()
+        ctrl.conn.in_waiting = 0
+        ctrl.conn.read.side_effect = [b"FA014250000;SM0042;"]
+        self.assertEqual(ctrl.poll_state(slow=False), (14.25, 42, None, None))
+        ctrl.conn.read.assert_called_once_with(19)
+
+    def test_leftover_reply_discarded_before_next_command(self):
+        ctrl = _make_ctrl()
+        ctrl.conn.in_waiting = 12
+        ctrl.conn.read.side_effect = [b"SM0120;PC050;", b"FA014074000;"]
+        self.assertEqual(ctrl.get_s_meter(), 120)
+        # PC050; was never asked for; it must not answer the FA read.
+        self.assertEqual(ctrl.get_frequency(), 14.074)
+        self.assertEqual(ctrl.conn.reset_input_buffer.call_count, 2)
+
+    def test_late_reply_does_not_shift_later_reads(self):
+        ctrl = _make_ctrl()
+        ctrl.conn.in_waiting = 0
+        ctrl.conn.read.side_effect = lambda n: b""
+        with patch.object(Yaesu991AControl, "_READ_DEADLINE_S", 0.001):
+            self.assertEqual(ctrl.get_frequency(use_cache=False), 0.0)
+        # The FA reply turns up after the next command's input reset.
+        ctrl.conn.read.side_effect = [b"FA014074000;", b"SM0042;", b"PC050;"]
+        self.assertEqual(ctrl.get_s_meter(use_cache=False), 42)
+        self.assertEqual(ctrl.get_rf_power(), 50)
+
+    def test_question_mark_reply_skipped(self):
+        ctrl = _make_ctrl()
+        _set_response(ctrl, "?;FA007000000")
+        self.assertEqual(ctrl.set_mode_freq_verify("LSB", 7.0), 7.0)
+        _set_response(ctrl, "?;SM0042")
+        self.assertEqual(ctrl.get_s_meter(use_cache=False), 42)
+
+    def test_no_reply_returns_none_after_deadline(self):
+        ctrl = _make_ctrl()
+        ctrl.conn.in_waiting = 0
+        ctrl.conn.read.return_value = b""
+        self.assertIsNone(ctrl._execute("FA", read=True))
+
+    def test_internal_scan_wrappers(self):
+        ctrl = _make_ctrl()
+        self.assertTrue(ctrl.start_scan_up())
+        self.assertEqual(_last_write(ctrl), "SC1")
+        self.assertTrue(ctrl.stop_scan())
+        self.assertEqual(_last_write(ctrl), "SC0")
+
+    def test_setters_write_preformatted_bytes(self):
+        ctrl = _make_ctrl()
+        ctrl.set_frequency_hz(7_074_000)
+        ctrl.set_rf_power(25)
+        self.assertEqual(
+            [c.args[0] for c in ctrl.conn.write.call_args_list],
+            [b"FA007074000;", b"PC025;"],
+        )
+
+    @unittest.skipIf(sys.platform.startswith("win"), "pipes are not selectable on Windows")
+    def test_selector_waits_for_readable_port(self):
+        import os
+        ctrl = _make_ctrl()
+        r, w = os.pipe()
+        try:
+            ctrl.conn.fileno.return_value = r
+            ctrl._sel = ctrl._make_selector()
+            self.assertIsNotNone(ctrl._sel)
+            ctrl.conn.in_waiting = 0
+            ctrl.conn.read.return_value = b"PC050;"
+            # Nothing readable: no read() at all, None once the budget is spent.
+            self.assertIsNone(ctrl._read_reply())
+            ctrl.conn.read.assert_not_called()
+            os.write(w, b"x")
+            self.assertEqual(ctrl._read_reply(), "PC050")
+            ctrl._close_port()
+            self.assertIsNone(ctrl._sel)
+        finally:
+            os.close(r)
+            os.close(w)
+
+    def test_selector_unavailable_without_fd(self):
+        ctrl = _make_ctrl()
+        ctrl.conn.fileno.side_effect = OSError("no fd")
+        self.assertIsNone(ctrl._make_selector())
+
+    def test_disconnect_clears_buffer(self):
+        ctrl = _make_ctrl()
+        ctrl._rx_buf += b"PC050;"
+        ctrl.disconnect()
+        self.assertEqual(ctrl._rx_buf, bytearray())
+
+
+# ===========================================================================
+# Single I/O worker – all port access happens on one thread
+# ===========================================================================
+
+class TestIoWorker(unittest.TestCase):
+
+    def test_port_access_confined_to_worker_thread(self):
+        import threading
+        ctrl = _make_ctrl()
+        writers = set()
+        ctrl.conn.write.side_effect = lambda data: writers.add(threading.get_ident())
+        callers = [threading.Thread(target=ctrl.ptt_off) for _ in range(8)]
+        for t in callers:
+            t.start()
+        for t in callers:
+            t.join(timeout=2)
+        ctrl.ptt_on()
+        self.assertEqual(ctrl.conn.write.call_count, 9)
+        self.assertEqual(writers, {ctrl._io_thread.ident})
+
+    def test_worker_survives_port_exception(self):
+        ctrl = _make_ctrl()
+        ctrl.conn.write.side_effect = [OSError("unplugged"), None]
+        self.assertIsNone(ctrl._execute("FA", read=True))
+        ctrl.ptt_off()
+        self.assertEqual(_last_write(ctrl), "TX0")
+
+    def test_command_queued_behind_disconnect_is_dropped_quietly(self):
+        ctrl = _make_ctrl()
+        ctrl._close_port()
+        buf = io.StringIO()
+        with patch("sys.stdout", buf):
+            self.assertIsNone(ctrl._transact(b"FA;", True))
+            self.assertEqual(ctrl._transact_batch(b"FA;SM0;", ["FA", "SM0"]), {})
+        self.assertEqual(buf.getvalue(), "")
+
+    def test_disconnect_runs_on_worker(self):
+        ctrl = _make_ctrl()
+        conn = ctrl.conn
+        ctrl.disconnect()
+        conn.close.assert_called_once()
+        self.assertIsNone(ctrl.conn)
+
+    def test_disconnect_without_connection_does_not_start_worker(self):
+        ctrl = Yaesu991AControl()
+        with patch.object(ctrl, "_submit") as m_submit:
+            ctrl.disconnect()
+        m_submit.assert_not_called()
+        self.assertIsNone(ctrl._io_thread)
+
+
+# ===========================================================================
+# Getter response cache
+# ===========================================================================
+
+class TestResponseCache(unittest.TestCase):
+
+    def test_repeat_get_served_from_cache(self):
+        ctrl = _make_ctrl()
+        _set_response(ctrl, "FA014250000")
+        ctrl.get_frequency()
+        ctrl.get_frequency()
+        self.assertEqual(ctrl.conn.write.call_count, 1)
+
+    def test_expired_entry_requeries(self):
+        ctrl = _make_ctrl()
+        ctrl.rig_set_cache(0, True)
+        _set_response(ctrl, "PC050")
+        ctrl.get_rf_power()
+        ctrl.get_rf_power()
+        self.assertEqual(ctrl.conn.write.call_count, 2)
+
+    def test_cache_disabled(self):
+        ctrl = _make_ctrl()
+        ctrl.rig_set_cache(500, False)
+        _set_response(ctrl, "SM0100")
+        ctrl.get_s_meter()
+        ctrl.get_s_meter()
+        self.assertEqual(ctrl.conn.write.call_count, 2)
+
+    def test_setters_skip_write_when_cache_shows_target(self):
+        ctrl = _make_ctrl()
+        ctrl.set_frequency(14.074)
+        ctrl.set_frequency(14.074)
+        ctrl.set_rf_power(50)
+        ctrl.set_rf_power(50)
+        _set_response(ctrl, "MD02")
+        ctrl.get_mode()
+        ctrl.set_mode("usb")
+        writes = [c.args[0] for c in ctrl.conn.write.call_args_list]
+        self.assertEqual(writes, [b"FA014074000;", b"PC050;", b"MD0;"])
+
+    def test_forced_set_writes_despite_fresh_cache(self):
+        # A front-panel change inside the TTL must not swallow a user APPLY.
+        ctrl = _make_ctrl()
+        ctrl.set_frequency(14.074)
+        ctrl.set_rf_power(50)
+        self.assertEqual(ctrl.set_frequency(14.074, force=True), 14_074_000)
+        self.assertEqual(ctrl.set_rf_power(50, force=True), 50)
+        self.assertEqual(ctrl.conn.write.call_count, 4)
+
+    def test_failed_set_is_not_cached_as_current(self):
+        ctrl = _make_ctrl()
+        ctrl.conn.write.side_effect = [OSError("unplugged"), None, OSError("unplugged"), None]
+        buf = io.StringIO()
+        with patch("sys.stdout", buf):
+            ctrl.set_frequency(14.074)
+            ctrl.set_frequency(14.074)
+            ctrl.set_rf_power(50)
+            ctrl.set_rf_power(50)
+        self.assertEqual(ctrl.conn.write.call_count, 4)
+
+    def test_disconnected_set_is_not_cached(self):
+        ctrl = Yaesu991AControl()
+        ctrl.set_frequency(14.074)
+        ctrl.set_rf_power(50)
+        self.assertEqual(ctrl._cache, {})
+
+    def test_connect_clears_cache(self):
+        ctrl = Yaesu991AControl(port="/dev/ttyUSB0")
+        ctrl._cache["FA"] = (14.074, 0.0)
+        with patch("ft991a_cat.serial"), patch.object(ctrl, "_start_io_worker"):
+            ctrl.connect()
+        self.assertEqual(ctrl._cache, {})
+
+    def test_setters_write_again_once_cache_is_stale(self):
+        ctrl = _make_ctrl()
+        ctrl.rig_set_cache(0, True)
+        ctrl.set_frequency(14.074)
+        ctrl.set_frequency(14.074)
+        self.assertEqual(ctrl.conn.write.call_count, 2)
+
+    def test_set_frequency_hz_sends_exact_value(self):
+        ctrl = _make_ctrl()
+        self.assertEqual(ctrl.set_frequency_hz(146_520_000), 146_520_000)
+        self.assertEqual(_last_write(ctrl), "FA146520000")
+        self.assertEqual(ctrl.get_frequency(), 146.52)
+
+    def test_set_frequency_seeds_frequency_and_evicts_s_meter(self):
+        ctrl = _make_ctrl()
+        _set_response(ctrl, "SM0100")
+        ctrl.get_s_meter()
+        self.assertEqual(ctrl.set_frequency(14.074), 14_074_000)
+        self.assertNotIn("SM0", ctrl._cache)
+        ctrl.conn.write.reset_mock()
+        self.assertAlmostEqual(ctrl.get_frequency(), 14.074)
+        ctrl.conn.write.assert_not_called()
+
+    def test_get_frequency_use_cache_false_reads_radio(self):
+        ctrl = _make_ctrl()
+        ctrl.set_frequency(14.074)
+        _set_response(ctrl, "FA014075000")
+        self.assertAlmostEqual(ctrl.get_frequency(use_cache=False), 14.075)
+
+    def test_set_rf_power_seeds_cache(self):
+        ctrl = _make_ctrl()
+        ctrl.set_rf_power(150)
+        ctrl.conn.write.reset_mock()
+        self.assertEqual(ctrl.get_rf_power(), 100)
+        ctrl.conn.write.assert_not_called()
+
+    def test_set_mode_evicts_mode(self):
+        ctrl = _make_ctrl()
+        _set_response(ctrl, "MD02")
+        ctrl.get_mode()
+        ctrl.set_mode("LSB")
+        _set_response(ctrl, "MD01")
+        self.assertEqual(ctrl.get_mode(), "LSB")
+
+    def test_failed_read_not_cached(self):
+        ctrl = _make_ctrl()
+        _set_response(ctrl, "?")
+        self.assertEqual(ctrl.get_rf_power(), 0)
+        self.assertNotIn("PC", ctrl._cache)
+
+
+# ===========================================================================
+# Batched queries
+# ===========================================================================
+
+class TestQueryBatch(unittest.TestCase):
+
+    def test_single_write_for_all_commands(self):
+        ctrl = _make_ctrl()
+        _set_response(ctrl, "FA014074000;SM0042;PC050;MD02")
+        ctrl.query_batch(["FA", "SM0", "PC", "MD0"])
+        ctrl.conn.write.assert_called_once_with(b"FA;SM0;PC;MD0;")
+
+    def test_terminated_commands_not_doubled(self):
+        ctrl = _make_ctrl()
+        _set_response(ctrl, "FA014074000;SM0042")
+        replies = ctrl.query_batch(["FA;", "SM0;"])
+        ctrl.conn.write.assert_called_once_with(b"FA;SM0;")
+        self.assertEqual(replies, {"FA": "FA014074000", "SM": "SM0042"})
+
+    def test_replies_keyed_by_prefix(self):
+        ctrl = _make_ctrl()
+        _set_response(ctrl, "FA014074000;SM0042;PC050;MD02")
+        replies = ctrl.query_batch(["FA", "SM0", "PC", "MD0"])
+        self.assertEqual(replies, {"FA": "FA014074000", "SM": "SM0042",
+                                   "PC": "PC050", "MD": "MD02"})
+        self.assertAlmostEqual(ctrl.parse_frequency(replies["FA"]), 14.074)
+        self.assertEqual(ctrl.parse_s_meter(replies["SM"]), 42)
+        self.assertEqual(ctrl.parse_rf_power(replies["PC"]), 50)
+        self.assertEqual(ctrl.parse_mode(replies["MD"]), "USB")
+
+    def test_missing_reply_absent(self):
+        ctrl = _make_ctrl()
+        ctrl.conn.in_waiting = 0
+        ctrl.conn.read.side_effect = [b"MD02;"] + [b""] * 1000
+        replies = ctrl.query_batch(["MD0", "PC"])
+        self.assertEqual(replies, {"MD": "MD02"})
+
+    def test_set_mode_freq_verify_is_one_write(self):
+        ctrl = _make_ctrl()
+        _set_response(ctrl, "FA007000000")
+        self.assertEqual(ctrl.set_mode_freq_verify("lsb", 7.0), 7.0)
+        ctrl.conn.write.assert_called_once_with(b"MD01;FA007000000;FA;")
+        self.assertEqual(ctrl.get_frequency(), 7.0)
+        ctrl.conn.write.assert_called_once()
+
+    def test_set_mode_freq_verify_without_reply(self):
+        ctrl = _make_ctrl()
+        ctrl.conn.in_waiting = 0
+        ctrl.conn.read.return_value = b""
+        self.assertIsNone(ctrl.set_mode_freq_verify("NOPE", 14.074))
+        ctrl.conn.write.assert_called_once_with(b"FA014074000;FA;")
+        self.assertIsNone(Yaesu991AControl().set_mode_freq_verify("USB", 14.0))
+
+    def test_poll_state_reads_everything_in_one_write(self):
+        ctrl = _make_ctrl()
+        _set_response(ctrl, "FA014074000;SM0042;PC050;MD02;")
+        self.assertEqual(ctrl.poll_state(), (14.074, 42, 50, "USB"))
+        ctrl.conn.write.assert_called_once_with(b"FA;SM0;PC;MD0;")
+        self.assertEqual(ctrl.mode_query_cmd, "MD0")
+        # Seeded cache: no further serial traffic for the plain getters.
+        self.assertEqual(ctrl.get_s_meter(), 42)
+        self.assertEqual(ctrl.get_mode(), "USB")
+        ctrl.conn.write.assert_called_once()
+
+    def test_poll_state_fast_skips_power_and_mode(self):
+        ctrl = _make_ctrl()
+        _set_response(ctrl, "FA007074000;SM0000;")
+        self.assertEqual(ctrl.poll_state(slow=False), (7.074, 0, None, None))
+        ctrl.conn.write.assert_called_once_with(b"FA;SM0;")
+
+    def test_wait_for_smeter_stable_returns_on_agreement(self):
+        ctrl = _make_ctrl()
+        with patch.object(ctrl, "get_s_meter", side_effect=[10, 80, 81, 200]) as m_s, \
+                patch("ft991a_cat.time.sleep"):
+            self.assertEqual(ctrl.wait_for_smeter_stable(max_ms=1000), 81)
+        self.assertEqual(m_s.call_count, 3)
+        m_s.assert_called_with(use_cache=False)
+
+    def test_wait_for_smeter_stable_ignores_stale_first_reading(self):
+        # Two matching readings of the old channel must not count as settled.
+        ctrl = _make_ctrl()
+        with patch.object(ctrl, "get_s_meter", side_effect=[5, 5, 120, 121]), \
+                patch("ft991a_cat.time.sleep"):
+            self.assertEqual(ctrl.wait_for_smeter_stable(max_ms=1000), 121)
+
+    def test_wait_for_smeter_stable_gives_up_at_deadline(self):
+        ctrl = _make_ctrl()
+        with patch.object(ctrl, "get_s_meter", return_value=5):
+            self.assertEqual(ctrl.wait_for_smeter_stable(max_ms=0), 5)
+
+    def test_disconnected_returns_empty(self):
+        self.assertEqual(Yaesu991AControl().query_batch(["FA"]), {})
+
+    def test_parsers_reject_malformed(self):
+        self.assertIsNone(Yaesu991AControl.parse_frequency("FAxyz"))
+        self.assertIsNone(Yaesu991AControl.parse_s_meter(None))
+        self.assertIsNone(Yaesu991AControl.parse_rf_power("SM0100"))
+        self.assertIsNone(Yaesu991AControl.parse_mode("MD"))
+
+    def test_connect_uses_short_port_timeouts(self):
+        ctrl = Yaesu991AControl(port="COM9")
+        with patch("ft991a_cat.serial") as m_serial, \
+                patch.object(ctrl, "_start_io_worker"):
+            ok, err = ctrl.connect()
+        self.assertTrue(ok, err)
+        kwargs = m_serial.Serial.call_args.kwargs
+        self.assertEqual(kwargs["timeout"], 0.05)
+        self.assertEqual(kwargs["inter_byte_timeout"], 0.01)
+        self.assertEqual(kwargs["write_timeout"], 0.1)
+        self.assertTrue(kwargs["exclusive"])
+
+    def test_serial_imported_on_first_connect(self):
+        import ft991a_cat
+        stub = types.ModuleType("serial")
+        with patch.object(ft991a_cat, "serial", None), \
+                patch.dict(sys.modules, {"serial": stub}):
+            self.assertIs(ft991a_cat._load_serial(), stub)
+            self.assertIs(ft991a_cat.serial, stub)
+
+    def test_connect_requests_low_latency_mode(self):
+        ctrl = Yaesu991AControl(port="/dev/ttyUSB0")
+        with patch("ft991a_cat.serial") as m_serial, \
+                patch.object(ctrl, "_start_io_worker"):
+            ctrl.connect()
+        m_serial.Serial.return_value.set_low_latency_mode.assert_called_once_with(True)
+
+    def test_connect_tolerates_unsupported_low_latency(self):
+        ctrl = Yaesu991AControl(port="/dev/ttyACM0")
+        with patch("ft991a_cat.serial") as m_serial, \
+                patch.object(ctrl, "_start_io_worker"):
+            m_serial.Serial.return_value.set_low_latency_mode.side_effect = ValueError("no")
+            ok, err = ctrl.connect()
+        self.assertTrue(ok, err)
+        self.assertIsNotNone(ctrl.conn)
+
+    def test_refused_low_latency_falls_back_to_sysfs_timer(self):
+        ctrl = Yaesu991AControl(port="/dev/ttyUSB3")
+        m_open = mock_open()
+        with patch("ft991a_cat.serial") as m_serial, \
+                patch.object(ctrl, "_start_io_worker"), \
+                patch("ft991a_cat.os.path.realpath", side_effect=lambda p: p), \
+                patch("builtins.open", m_open):
+            m_serial.Serial.return_value.set_low_latency_mode.side_effect = OSError("no")
+            ok, err = ctrl.connect()
+        self.assertTrue(ok, err)
+        m_open.assert_called_once_with(
+            "/sys/bus/usb-serial/devices/ttyUSB3/latency_timer", "w")
+        m_open.return_value.write.assert_called_once_with("1")
+
+    def test_trailing_int_parser(self):
+        parse = Yaesu991AControl._parse_trailing_int
+        self.assertEqual(parse("SM0042", "SM0", 3), 42)
+        self.assertIsNone(parse("SM004", "SM0", 3))
+        self.assertIsNone(parse("SM0x42", "SM0", 3))
+        self.assertIsNone(parse("PC050", "SM0", 3))
+        self.assertIsNone(parse("", "PC", 3))
+
+    def test_swr_meter_parse(self):
+        ctrl = _make_ctrl()
+        _set_response(ctrl, "RM6025")
+        self.assertEqual(ctrl.get_swr_meter(), 25)
+        _set_response(ctrl, "RM6")
+        self.assertEqual(ctrl.get_swr_meter(), 0)
+
 
 # ===========================================================================
 # AB – VFO-A to VFO-B
@@ -437,7 +967,7 @@ class TestCO(unittest.TestCase):
 
     def test_get_contour(self):
         ctrl = _make_ctrl()
-        _set_response(ctrl, "CO001000")
+        _set_response(ctrl, "CO011000")
         self.assertEqual(ctrl.get_contour(1), 1000)
 
     def test_set_contour_invalid_sub(self):
@@ -32,8 +32,10 @@ from __future__ import annotations
 
 import configparser
 import os
+import queue
 import sys
 import tempfile
+import threading
 import time
 import traceback
 import types
@@ -360,12 +362,22 @@ def test_infer_band_from_freq():
     assert fn(gui, 28.500)  == "10m"
 
 
+def test_band_table_mirrors_bands():
+    assert [row[4] for row in main._BAND_TABLE] == list(main.BANDS)
+    for start, end, step, mode, name in main._BAND_TABLE:
+        plan = main.BANDS[name]
+        assert (start, end, step, mode) == (plan["start"], plan["end"], plan["step"], plan["mode"])
+
+
 def test_infer_band_out_of_range():
     gui = mock.MagicMock(spec=main.RadioGUI)
     fn  = main.RadioGUI.infer_band_from_freq
     assert fn(gui, 0.0)   is None
     assert fn(gui, 500.0) is None
     assert fn(gui, 2.5)   is None   # between 160m and 80m
+    # Band edges are inclusive on both ends.
+    for start, end, _step, _mode, name in main._BAND_TABLE:
+        assert fn(gui, start) == name and fn(gui, end) == name
 
 
 def test_appconfig_tx_audio_defaults():
@@ -1159,6 +1171,680 @@ def test_maybe_assist_prefill_cancels_cq_retry_on_response():
     gui._cancel_cq_retry.assert_called_once()
 
 
+def _queue_gui(*items):
+    """MagicMock GUI with a real _ui_queue holding *items*."""
+    gui = mock.MagicMock()
+    gui._ui_queue = queue.Queue()
+    for item in items:
+        gui._ui_queue.put(item)
+    return gui
+
+
+def test_connect_readback_worker_posts_to_ui_queue():
+    """Connect-time CAT reads run on the worker and reach the UI via the queue."""
+    gui = _queue_gui()
+    gui.radio.get_frequency.return_value = 14.074
+    gui.radio.get_rf_power.return_value  = 50
+    gui.radio.get_mode.return_value      = "USB"
+    gui.infer_band_from_freq.return_value = "20m"
+    main.RadioGUI._connect_readback_worker(gui)
+    assert gui._ui_queue.get_nowait() == ("connect_readback", "20m", 50, "USB")
+
+
+def test_apply_connect_readback_sets_band_and_controls():
+    gui = mock.MagicMock()
+    gui.active_band = None
+    main.RadioGUI._apply_connect_readback(gui, "40m", 25, "LSB")
+    assert gui.active_band == "40m"
+    gui.rf_power_var.set.assert_called_once_with(25)
+    gui.rf_power_status.config.assert_called_once_with(text="READ 025")
+    gui.mode_var.set.assert_called_once_with("LSB")
+
+
+def _one_poll_iteration_gui():
+    """MagicMock GUI whose radio_poll_thread loop runs exactly once."""
+    gui = _queue_gui()
+    gui._shutdown.wait.side_effect = [False, True]
+    gui.scanning = False
+    gui._poll_last_f = None
+    gui._poll_last_s = None
+    gui.radio.is_connected.return_value = True
+    for name in ("parse_frequency", "parse_mode", "parse_s_meter", "parse_rf_power"):
+        setattr(gui.radio, name, getattr(main.Yaesu991AControl, name))
+    gui.radio.poll_state = (
+        lambda slow=True: main.Yaesu991AControl.poll_state(gui.radio, slow)
+    )
+    return gui
+
+
+def _drain(q):
+    items = []
+    while not q.empty():
+        items.append(q.get_nowait())
+    return items
+
+
+def test_radio_poll_thread_batches_full_poll_in_one_query():
+    gui = _one_poll_iteration_gui()
+    gui.radio.query_batch.return_value = {
+        "FA": "FA014074000", "SM": "SM0042", "MD": "MD02", "PC": "PC050",
+    }
+    gui.radio.mode_query_cmd = "MD0"
+    main.RadioGUI.radio_poll_thread(gui)
+    gui.radio.query_batch.assert_called_once_with(["FA", "SM0", "PC", "MD0"])
+    for getter in ("get_frequency", "get_s_meter", "get_mode", "get_rf_power"):
+        getattr(gui.radio, getter).assert_not_called()
+    items = _drain(gui._ui_queue)
+    for expected in (("freq", 14.074), ("s_meter", 42), ("mode", "USB"), ("rf_power", 50)):
+        assert expected in items, items
+
+
+def _inline_threads():
+    """Patch threading.Thread so started targets run synchronously."""
+    def _thread(target=None, args=(), kwargs=None, **_kw):
+        return types.SimpleNamespace(start=lambda: target(*args, **(kwargs or {})))
+    return mock.patch.object(main.threading, "Thread", side_effect=_thread)
+
+
+def test_apply_rf_power_uses_setter_result_without_readback():
+    gui = mock.MagicMock()
+    gui.radio.is_connected.return_value = True
+    gui.rf_power_var.get.return_value = 250
+    gui.radio.set_rf_power.return_value = 100
+    with _inline_threads():
+        main.RadioGUI.apply_rf_power(gui)
+    gui.radio.get_rf_power.assert_not_called()
+    gui._ui_queue.put.assert_called_once_with(("rf_power_set", 100))
+    gui._poll_slow_now.set.assert_called_once()
+
+    main.RadioGUI._apply_rf_power_result(gui, 100)
+    gui.rf_power_var.set.assert_called_once_with(100)
+    gui.rf_power_status.config.assert_called_once_with(text="SET 100")
+
+
+def test_apply_rf_power_failed_write_shows_error_not_set():
+    gui = mock.MagicMock()
+    gui.radio.is_connected.return_value = True
+    gui.rf_power_var.get.return_value = 50
+    gui.radio.set_rf_power.return_value = None    # write never reached the rig
+    with _inline_threads():
+        main.RadioGUI.apply_rf_power(gui)
+    gui._ui_queue.put.assert_called_once_with(("rf_power_set", None))
+
+    main.RadioGUI._apply_rf_power_result(gui, None)
+    gui.rf_power_var.set.assert_not_called()
+    gui.rf_power_status.config.assert_called_once_with(text="INVALID")
+
+
+def test_apply_handlers_do_no_cat_io_on_tk_thread():
+    gui = mock.MagicMock()
+    gui._VALID_MODES = main.RadioGUI._VALID_MODES
+    gui.radio.is_connected.return_value = True
+    gui.mode_var.get.return_value = "FM"
+    gui.rf_power_var.get.return_value = 20
+    with mock.patch.object(main.threading, "Thread") as m_thread:
+        main.RadioGUI.apply_mode(gui)
+        main.RadioGUI.apply_rf_power(gui)
+        main.RadioGUI.manual_log(gui)
+    assert m_thread.return_value.start.call_count == 3
+    gui.radio.set_mode.assert_not_called()
+    gui.radio.set_rf_power.assert_not_called()
+    gui.radio.get_frequency.assert_not_called()
+    gui.log_to_file.assert_not_called()
+
+
+def test_apply_mode_requests_immediate_slow_poll():
+    gui = mock.MagicMock()
+    gui._VALID_MODES = main.RadioGUI._VALID_MODES
+    gui.radio.is_connected.return_value = True
+    gui.mode_var.get.return_value = "LSB"
+    with _inline_threads():
+        main.RadioGUI.apply_mode(gui)
+    gui.radio.set_mode.assert_called_once_with("LSB")
+    gui._poll_slow_now.set.assert_called_once()
+    gui._ui_queue.put.assert_called_once_with(("mode_set", "LSB"))
+
+
+def test_apply_handlers_accept_tk_event_when_bound_directly():
+    gui = mock.MagicMock()
+    gui._VALID_MODES = main.RadioGUI._VALID_MODES
+    gui.radio.is_connected.return_value = True
+    gui.mode_var.get.return_value = "USB"
+    gui.rf_power_var.get.return_value = 50
+    gui.radio.set_rf_power.return_value = 50
+    event = mock.MagicMock()
+    with _inline_threads():
+        main.RadioGUI.apply_mode(gui, event)
+        main.RadioGUI.apply_rf_power(gui, event)
+    gui.radio.set_mode.assert_called_once_with("USB")
+    gui.radio.set_rf_power.assert_called_once_with(50, force=True)
+
+
+def test_radio_poll_thread_honours_slow_refresh_request():
+    gui = _one_poll_iteration_gui()
+    gui._poll_slow_now = threading.Event()
+    gui._poll_slow_now.set()
+    gui.radio.query_batch.return_value = {"MD": "MD01", "PC": "PC020"}
+    gui.radio.mode_query_cmd = "MD0"
+    main.RadioGUI.radio_poll_thread(gui)
+    assert not gui._poll_slow_now.is_set()
+    assert ("mode", "LSB") in _drain(gui._ui_queue)
+
+
+def test_radio_poll_thread_queues_only_changed_readouts():
+    gui = _one_poll_iteration_gui()
+    gui._shutdown.wait.side_effect = [False, False, False, True]
+    gui.radio.poll_state = mock.MagicMock(side_effect=[
+        (14.074, 42, 50, "USB"),
+        (14.074, 42, None, None),
+        (14.0741, 42, None, None),
+    ])
+    with mock.patch.object(main.time, "monotonic", side_effect=[0.0, 0.0, 1.0, 1.0, 2.0, 2.0]):
+        main.RadioGUI.radio_poll_thread(gui)
+    items = [i for i in _drain(gui._ui_queue) if i[0] in ("freq", "s_meter")]
+    assert items == [("freq", 14.074), ("s_meter", 42), ("freq", 14.0741)]
+
+
+def test_refresh_connection_ui_forces_next_poll_sample_through():
+    gui = mock.MagicMock()
+    gui._poll_last_f = 14.074
+    gui._poll_last_s = 42
+    main.RadioGUI.refresh_connection_ui(gui)
+    assert gui._poll_last_f is None and gui._poll_last_s is None
+
+
+def test_radio_poll_thread_sleeps_on_shutdown_until_next_deadline():
+    gui = _one_poll_iteration_gui()
+    gui.radio.query_batch.return_value = {"FA": "FA014074000", "SM": "SM0042"}
+    gui.radio.mode_query_cmd = "MD0"
+    main.RadioGUI.radio_poll_thread(gui)
+    first, second = (c.args[0] for c in gui._shutdown.wait.call_args_list)
+    assert first == 0.0
+    assert 0.1 < second <= 0.2
+    gui._shutdown.is_set.assert_not_called()
+
+
+def _ui_queue_gui(*items):
+    """MagicMock GUI whose _ui_queue holds *items* for one process_ui_queue pass."""
+    import collections as _collections
+    gui = _queue_gui(*items)
+    for name in ("_UI_POLL_MS", "_UI_FALLBACK_MS", "_UI_WAKE_EVENT", "_UI_IDLE_MAX_MS",
+                 "_UI_COALESCE_KEYS", "_LOG_FLUSH_MS", "_LOG_MAX_LINES"):
+        setattr(gui, name, getattr(main.RadioGUI, name))
+    gui._ui_idle_polls = 0
+    gui._ui_wake_ok = True
+    gui._log_pending = _collections.deque(maxlen=gui._LOG_MAX_LINES)
+    gui._log_flush_scheduled = False
+    gui._apply_ui_item = lambda item: main.RadioGUI._apply_ui_item(gui, item)
+    gui._drain_ui_queue = lambda: main.RadioGUI._drain_ui_queue(gui)
+    gui._queue_log_text = lambda text: main.RadioGUI._queue_log_text(gui, text)
+    return gui
+
+
+def test_process_ui_queue_skips_focused_controls_without_focus_get():
+    gui = _ui_queue_gui(("rf_power", 40), ("mode", "FM"))
+    gui._rf_power_focused = True
+    gui._mode_focused     = True
+    main.RadioGUI.process_ui_queue(gui)
+    gui.root.focus_get.assert_not_called()
+    gui.rf_power_var.set.assert_not_called()
+    gui.mode_var.set.assert_not_called()
+    assert gui._current_rf_power == 40 and gui._current_mode == "FM"
+
+
+def test_process_ui_queue_updates_unfocused_controls():
+    gui = _ui_queue_gui(("rf_power", 40), ("mode", "FM"))
+    gui._rf_power_focused = False
+    gui._mode_focused     = False
+    main.RadioGUI.process_ui_queue(gui)
+    gui.rf_power_var.set.assert_called_once_with(40)
+    gui.mode_var.set.assert_called_once_with("FM")
+
+
+def _radio_log_gui():
+    """MagicMock GUI with the radio_log.csv writer state and a real writer."""
+    gui = _queue_gui()
+    gui._log_q      = queue.Queue()
+    gui._log_thread = None
+    gui._log_lock   = threading.Lock()
+    gui._radio_log_writer = lambda: main.RadioGUI._radio_log_writer(gui)
+    gui._last_ts_sec = 0
+    gui._last_ts_str = ""
+    return gui
+
+
+def test_log_to_file_writes_rows_on_one_writer_thread():
+    import builtins
+    gui = _radio_log_gui()
+    real_open = builtins.open
+    with tempfile.TemporaryDirectory() as td:
+        path = os.path.join(td, "radio_log.csv")
+        with mock.patch.object(main, "RADIO_LOG_PATH", path), \
+                mock.patch("builtins.open", side_effect=real_open) as m_open:
+            main.RadioGUI.log_to_file(gui, 146.52, 80, "first")
+            writer = gui._log_thread
+            main.RadioGUI.log_to_file(gui, 146.55, 90, "second")
+            assert gui._log_thread is writer
+            main.RadioGUI._close_radio_log(gui)
+        assert m_open.call_count == 1, m_open.call_count
+        assert not writer.is_alive() and gui._log_thread is None
+        with real_open(path, newline="") as f:
+            rows = f.read().splitlines()
+        assert len(rows) == 2 and rows[1].endswith("146.5500,90,second"), rows
+
+
+def test_radio_log_writer_flushes_a_queued_burst_once():
+    gui = _radio_log_gui()
+    for i in range(3):
+        gui._log_q.put(["2026-01-01 12:00:00", "146.5200", 80, f"hit{i}"])
+    gui._log_q.put(None)
+    m_open = mock.mock_open()
+    with mock.patch("builtins.open", m_open):
+        main.RadioGUI._radio_log_writer(gui, "x.csv")
+    fh = m_open.return_value
+    fh.flush.assert_called_once()
+    written = "".join(c.args[0] for c in fh.write.call_args_list)
+    assert written.count("\r\n") == 3 and "hit2" in written, written
+
+
+def test_scan_log_lines_coalesce_into_one_insert():
+    gui = _ui_queue_gui()
+    for i in range(3):
+        main.RadioGUI._append_log_line(gui, f"{146.5 + i:.4f}", 80, f"hit{i}", "2026-01-01 12:00:0%d" % i)
+    gui.root.after.assert_called_once_with(250, gui._flush_log)
+    gui.log_box.insert.assert_not_called()
+
+    main.RadioGUI._flush_log(gui)
+    gui.log_box.insert.assert_called_once()
+    text = gui.log_box.insert.call_args[0][1]
+    assert text.count("\n") == 3 and "hit0" in text and "hit2" in text, text
+    gui.log_box.delete.assert_called_once_with("1.0", "end-501l")
+    gui.log_box.see.assert_called_once()
+    assert not gui._log_pending and gui._log_flush_scheduled is False
+
+    # An empty flush leaves the widget alone.
+    main.RadioGUI._flush_log(gui)
+    assert gui.log_box.insert.call_count == 1
+
+
+def _no_wait_stop():
+    """Real stop Event whose settle/dwell waits return at once."""
+
+    class _NoWaitEvent(threading.Event):
+        def wait(self, timeout=None):
+            return self.is_set()
+
+    return _NoWaitEvent()
+
+
+def _scan_gui():
+    """MagicMock GUI mid-scan where every step is a hit that holds."""
+    gui = _queue_gui()
+    gui._shutdown = threading.Event()
+    gui._scan_stop = threading.Event()
+    gui.scanning = True
+    gui._scan_thresh = 40
+    gui.radio.is_connected.return_value = True
+    gui.radio.get_frequency.return_value = 146.52
+    gui.radio.wait_for_smeter_stable.return_value = 200   # every step is a hit
+    gui.radio.get_s_meter.return_value = 200              # ... and holds
+    return gui
+
+
+def test_stop_scan_interrupts_dwell_immediately():
+    gui = _scan_gui()
+    stop = gui._scan_stop
+    t = threading.Thread(target=main.RadioGUI.scan_thread, args=(gui, "2m", stop))
+    t.start()
+    deadline = time.monotonic() + 2.0
+    while not gui.log_to_file.called and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert gui.log_to_file.called
+
+    t0 = time.monotonic()
+    gui.scanning = False
+    stop.set()
+    t.join(timeout=1.0)
+    assert not t.is_alive()
+    assert time.monotonic() - t0 < 0.5
+    assert ("ptt_state", True) in _drain(gui._ui_queue)
+
+
+def test_stale_scan_thread_leaves_new_scan_flags_alone():
+    gui = _scan_gui()
+    old_stop = threading.Event()
+    old_stop.set()                       # old scan was stopped ...
+    gui._scan_stop = threading.Event()   # ... and a new one started
+    main.RadioGUI.scan_thread(gui, "2m", old_stop)
+    assert gui.scanning is True
+    assert ("ptt_state", True) not in _drain(gui._ui_queue)
+
+
+def test_squelch_validator_accepts_only_0_to_255():
+    v = main.RadioGUI._validate_squelch
+    assert v("") and v("0") and v("255")
+    assert not v("256") and not v("4x") and not v("-1")
+
+
+def test_squelch_change_is_published_to_scan_thread():
+    gui = mock.MagicMock()
+    gui._scan_thresh = 40
+    gui.squelch_var.get.return_value = 90
+    main.RadioGUI._on_squelch_change(gui, "PY_VAR0", "", "write")
+    assert gui._scan_thresh == 90
+
+    gui.squelch_var.get.side_effect = ValueError("empty")
+    main.RadioGUI._on_squelch_change(gui)
+    assert gui._scan_thresh == 90
+
+
+def test_scan_thread_reads_live_squelch_each_step():
+    gui = _scan_gui()
+    gui._scan_thresh = 255
+    readings = iter([100, 100])
+
+    def s_meter(**_kw):
+        v = next(readings, None)
+        if v is None:
+            stop.set()
+            return 0
+        gui._scan_thresh = 90          # user lowers squelch mid-scan
+        return v
+
+    gui.radio.wait_for_smeter_stable.side_effect = s_meter
+    gui.radio.get_s_meter.return_value = 0     # signal drops after each hit
+    stop = _no_wait_stop()
+    main.RadioGUI.scan_thread(gui, "2m", stop)
+    assert gui.log_to_file.call_count == 2
+
+
+def test_scan_thread_steps_integer_hz_grid_and_wraps():
+    gui = _scan_gui()
+    gui.radio.get_frequency.return_value = 7.0101   # between channels
+    gui.radio.wait_for_smeter_stable.return_value = 0
+    tuned = []
+
+    def set_hz(hz):
+        tuned.append(hz)
+        if len(tuned) == 5:
+            stop.set()
+
+    gui.radio.set_frequency_hz.side_effect = set_hz
+    stop = _no_wait_stop()
+    plan = {"start": 7.000, "end": 7.020, "step": 0.005}
+    with mock.patch.dict(main.BANDS, {"test": plan}):
+        main.RadioGUI.scan_thread(gui, "test", stop)
+    assert tuned == [7_015_000, 7_020_000, 7_000_000, 7_005_000, 7_010_000], tuned
+
+
+def test_log_to_file_formats_timestamp_once_per_second():
+    gui = _radio_log_gui()
+    gui._log_thread = mock.MagicMock()   # writer already running
+    with mock.patch.object(main.time, "time", side_effect=[1000.1, 1000.9, 1001.2]), \
+            mock.patch.object(main.time, "strftime", wraps=time.strftime) as m_fmt:
+        for _ in range(3):
+            main.RadioGUI.log_to_file(gui, 146.52, 80, "hit")
+    assert m_fmt.call_count == 2
+    rows = [gui._log_q.get_nowait() for _ in range(3)]
+    assert rows[0][0] == rows[1][0] != rows[2][0]
+    assert rows[0][0] == time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(1000))
+
+
+def test_scan_dwell_releases_when_signal_drops():
+    gui = _scan_gui()
+    gui.radio.wait_for_smeter_stable.side_effect = [100, 0, 0]
+    gui.radio.get_s_meter.side_effect = [100, 60, 37]   # 37 < 40 - 2
+    stop = _no_wait_stop()
+
+    def tune(hz):
+        if gui.radio.set_frequency_hz.call_count == 3:
+            stop.set()
+
+    gui.radio.set_frequency_hz.side_effect = tune
+    main.RadioGUI.scan_thread(gui, "2m", stop)
+    assert gui.log_to_file.call_count == 1
+    assert gui.radio.get_s_meter.call_count == 3
+    gui.radio.get_s_meter.assert_called_with(use_cache=False)
+
+
+def test_process_ui_queue_skips_unchanged_readouts():
+    gui = _ui_queue_gui(("freq", 14.074), ("s_meter", 0), ("freq", 14.074), ("s_meter", 0))
+    gui._last_freq_txt = None
+    gui._last_s = None
+    main.RadioGUI.process_ui_queue(gui)
+    gui.freq_disp.config.assert_called_once_with(text="0014.0740")
+    gui.meter_var.set.assert_called_once_with(0)
+    assert gui._current_freq == 14.074
+
+    # A 10 Hz move is below the display resolution: no redraw.
+    gui._ui_queue.put(("freq", 14.07401))
+    main.RadioGUI.process_ui_queue(gui)
+    assert gui.freq_disp.config.call_count == 1
+    assert gui._current_freq == 14.07401
+
+    gui._ui_queue.put(("freq", 14.075))
+    main.RadioGUI.process_ui_queue(gui)
+    assert gui.freq_disp.config.call_count == 2
+
+
+def test_scan_thread_does_not_retune_unchanged_channel():
+    gui = _scan_gui()
+    gui.radio.wait_for_smeter_stable.return_value = 0
+    gui.radio.get_frequency.return_value = 7.0
+    stop = _no_wait_stop()
+    passes = []
+
+    def settle(**_kw):
+        passes.append(1)
+        if len(passes) == 3:
+            stop.set()
+        return 0
+
+    gui.radio.wait_for_smeter_stable.side_effect = settle
+    with mock.patch.dict(main.BANDS, {"one": {"start": 7.0, "end": 7.0, "step": 0.001}}):
+        main.RadioGUI.scan_thread(gui, "one", stop)
+    assert len(passes) == 3
+    gui.radio.set_frequency_hz.assert_called_once_with(7_000_000)
+
+
+def test_log_to_file_formats_frequency_once_for_csv_and_log_box():
+    gui = _radio_log_gui()
+    gui._log_thread = mock.MagicMock()   # writer already running
+    main.RadioGUI.log_to_file(gui, 146.52, 80, "hit")
+    row = gui._log_q.get_nowait()
+    item = gui._ui_queue.get_nowait()
+    assert row[1] == "146.5200" and item[:2] == ("log", "146.5200")
+    assert row[1] is item[1]
+
+
+def test_toggle_scan_stop_restores_start_button():
+    gui = mock.MagicMock()
+    gui.scanning = True
+    main.RadioGUI.toggle_scan(gui)
+    gui._stop_scan.assert_called_once()
+    gui.scan_btn.config.assert_called_once_with(text="START SCAN", bg="lightgray")
+
+
+def test_process_ui_queue_coalesces_readouts_keeping_event_order():
+    gui = _ui_queue_gui(
+        ("s_meter", 10), ("status", "A"), ("s_meter", 20), ("status", "B"),
+        ("tx_state", "ARMED", "x"),
+        ("s_meter", 30),
+    )
+    gui._last_s = None
+    order = []
+    gui.meter_var.set.side_effect = lambda v: order.append(("s", v))
+    gui._apply_tx_state_update.side_effect = lambda *a: order.append(("tx",))
+    main.RadioGUI.process_ui_queue(gui)
+    # Readouts queued before the TX event land before it, newest value only.
+    assert order == [("s", 20), ("tx",), ("s", 30)], order
+    gui.conn_status.config.assert_called_once_with(text="B")
+    gui.root.after.assert_called_once_with(250, gui.process_ui_queue)
+
+
+def test_process_ui_queue_coalesces_per_widget_so_newest_status_wins():
+    gui = _ui_queue_gui(
+        ("audio_status", "Audio: starting"), ("audio_rms", 0.0123),
+        ("audio_status", "Audio: ERROR device lost"),
+        ("voice_audio_status", "RX Monitor: starting"), ("voice_rx_rms", 0.02),
+        ("voice_audio_status", "RX Monitor: stopped"),
+    )
+    main.RadioGUI.process_ui_queue(gui)
+    gui.audio_status.config.assert_called_once_with(text="Audio: ERROR device lost")
+    gui.voice_audio_status.config.assert_called_once_with(text="RX Monitor: stopped")
+
+
+def test_goto_band_sets_mode_and_frequency_in_one_verified_write():
+    gui = mock.MagicMock()
+    gui.radio.is_connected.return_value = True
+    gui.radio.set_mode_freq_verify.return_value = 7.0
+    with _inline_threads(), mock.patch.object(main.time, "sleep") as m_sleep:
+        main.RadioGUI.goto_band(gui, "40m")
+    gui.radio.set_mode_freq_verify.assert_called_once_with("LSB", 7.0)
+    gui.radio.set_frequency.assert_not_called()
+    m_sleep.assert_not_called()
+    assert gui._freq_step == 0.001 and gui.active_band == "40m"
+    gui.mode_var.set.assert_called_once_with("LSB")
+
+
+def test_goto_band_retries_frequency_when_readback_is_off():
+    gui = mock.MagicMock()
+    gui.radio.is_connected.return_value = True
+    gui.radio.set_mode_freq_verify.return_value = None
+    with _inline_threads():
+        main.RadioGUI.goto_band(gui, "20m")
+    gui.radio.set_frequency.assert_called_once_with(14.0)
+
+
+def test_goto_band_ignores_unknown_band():
+    gui = mock.MagicMock()
+    gui.active_band = None
+    main.RadioGUI.goto_band(gui, "11m")
+    assert gui.active_band is None
+    gui.radio.set_mode.assert_not_called()
+
+
+def test_ptt_allowed_uses_enabled_flag_without_tcl():
+    gui = mock.MagicMock()
+    gui.radio.is_connected.return_value = True
+    gui.scanning = False
+    gui._ptt_enabled = True
+    assert main.RadioGUI._ptt_allowed(gui) is True
+    gui._ptt_enabled = False
+    assert not main.RadioGUI._ptt_allowed(gui)
+    gui._ptt_enabled = True
+    gui.scanning = True
+    assert not main.RadioGUI._ptt_allowed(gui)
+    gui.ptt_btn.cget.assert_not_called()
+
+
+def test_disabled_ptt_state_blocks_press_without_keying():
+    gui = _ui_queue_gui(("ptt_state", False))
+    gui._set_ptt_enabled = lambda e: main.RadioGUI._set_ptt_enabled(gui, e)
+    gui._ptt_allowed = lambda: main.RadioGUI._ptt_allowed(gui)
+    gui.radio.is_connected.return_value = True
+    gui.scanning = False
+    main.RadioGUI._drain_ui_queue(gui)
+    gui.ptt_btn.config.assert_called_once_with(state=main.tk.DISABLED)
+    assert main.RadioGUI._on_ptt_press(gui, None) == "break"
+    gui.radio.ptt_on.assert_not_called()
+
+
+def test_ui_queue_wakes_tk_once_per_burst():
+    q = main._WakeQueue()
+    q.on_wake = mock.MagicMock()
+    q.put(("freq", 14.074))
+    q.put(("s_meter", 3))
+    q.on_wake.assert_called_once_with()
+    q.get_nowait()
+    q.get_nowait()
+    q.put(("freq", 7.074))
+    assert q.on_wake.call_count == 2
+
+
+def test_ui_queue_sheds_superseded_readouts_when_stalled():
+    q = main._WakeQueue(maxlen=8, droppable={"s_meter": "s_meter", "freq": "freq"})
+    q.put(("s_meter", 0))
+    q.put(("tx_state", "ARMED", "x"))
+    for i in range(1, 20):
+        q.put(("s_meter", i))
+    q.put(("freq", 14.074))
+    items = [q.get_nowait() for _ in range(q.qsize())]
+    assert len(items) <= 8, items
+    assert ("tx_state", "ARMED", "x") in items
+    assert items[-2:] == [("s_meter", 19), ("freq", 14.074)], items
+
+
+def test_ui_queue_never_drops_ordered_events():
+    q = main._WakeQueue(maxlen=4, droppable={"s_meter": "s_meter"})
+    for i in range(10):
+        q.put(("ft8_decode", i))
+    assert q.qsize() == 10
+
+
+def test_ui_queue_compacts_per_widget_keeping_newest_status():
+    q = main._WakeQueue(maxlen=4, droppable=main.RadioGUI._UI_COALESCE_KEYS)
+    q.put(("audio_rms", 0.01))
+    q.put(("audio_status", "Audio: ERROR device lost"))
+    for i in range(3):
+        q.put(("s_meter", i))
+    items = [q.get_nowait() for _ in range(q.qsize())]
+    assert ("audio_status", "Audio: ERROR device lost") in items, items
+    assert not any(i[0] == "audio_rms" for i in items), items
+
+
+def test_ui_queue_put_never_calls_into_tk():
+    gui = _ui_queue_gui()
+    gui._ui_wake = threading.Event()
+    gui._ui_queue = main._WakeQueue()
+    gui._ui_queue.on_wake = gui._ui_wake.set
+    gui._ui_queue.put(("tx_state", "TX_ACTIVE", "x"))   # from the TX thread
+    assert gui._ui_wake.is_set()
+    gui.root.event_generate.assert_not_called()
+
+
+def test_ui_wake_thread_forwards_one_event_and_exits_on_shutdown():
+    gui = _ui_queue_gui()
+    gui._ui_wake = threading.Event()
+    gui._shutdown = threading.Event()
+
+    def generate(*_a, **_kw):
+        gui._shutdown.set()
+        gui._ui_wake.set()
+
+    gui.root.event_generate.side_effect = generate
+    gui._ui_wake.set()
+    main.RadioGUI._ui_wake_thread(gui)
+    gui.root.event_generate.assert_called_once_with("<<UiQueue>>", when="tail")
+
+
+def test_failed_wake_falls_back_to_fast_polling():
+    gui = _ui_queue_gui()
+    gui._ui_wake = threading.Event()
+    gui._shutdown = threading.Event()
+    gui._ui_queue = main._WakeQueue()
+    gui._ui_queue.on_wake = gui._ui_wake.set
+    gui.root.event_generate.side_effect = RuntimeError("main thread is not in main loop")
+    gui._ui_wake.set()
+    main.RadioGUI._ui_wake_thread(gui)
+    assert gui._ui_queue.on_wake is None and gui._ui_wake_ok is False
+    gui._ui_queue.put(("status", "x"))
+    main.RadioGUI.process_ui_queue(gui)
+    gui.root.after.assert_called_once_with(16, gui.process_ui_queue)
+
+
+def test_ui_polling_backs_off_while_idle_and_snaps_back():
+    gui = _ui_queue_gui()
+    gui._ui_wake_ok = False
+    for _ in range(6):
+        main.RadioGUI.process_ui_queue(gui)
+    delays = [c.args[0] for c in gui.root.after.call_args_list]
+    assert delays == [32, 64, 128, 200, 200, 200], delays
+    gui._ui_queue.put(("s_meter", 5))
+    main.RadioGUI.process_ui_queue(gui)
+    gui.root.after.assert_called_with(16, gui.process_ui_queue)
+
+
 # ---------------------------------------------------------------------------
 # Run all tests
 # ---------------------------------------------------------------------------
@@ -1185,6 +1871,7 @@ if __name__ == "__main__":
     run("14. _switch_to_voice saves + stops",      test_switch_to_voice_saves_and_stops)
     run("15. RadioGUI._freq_step default",         test_freq_step_default)
     run("16. infer_band_from_freq — in-band",      test_infer_band_from_freq)
+    run("16b. _BAND_TABLE mirrors BANDS",          test_band_table_mirrors_bands)
     run("17. infer_band_from_freq — out-of-band",  test_infer_band_out_of_range)
     run("18. AppConfig — TX audio defaults",       test_appconfig_tx_audio_defaults)
     run("19. AppConfig.save_tx_audio — persists",  test_appconfig_save_tx_audio)
@@ -1224,13 +1911,64 @@ if __name__ == "__main__":
     run("43. _maybe_assist_prefill — gated TX_ACTIVE",     test_maybe_assist_prefill_gated_during_tx_active)
     run("44. _maybe_assist_prefill — gated ARMED",         test_maybe_assist_prefill_gated_during_armed)
     run("45. _maybe_assist_prefill — inactive session noop", test_maybe_assist_prefill_inactive_when_session_off)
-    run("46. _maybe_assist_prefill — no auto-arm (safety)", test_maybe_assist_prefill_no_auto_arm)
+    run("46. _maybe_assist_prefill — no auto-arm (safety)", test_maybe_assist_prefill_no_auto_arm_when_disabled)
+    run("46b. _maybe_assist_prefill — auto-arms when enabled", test_maybe_assist_prefill_auto_arms_when_enabled)
     run("47. _apply_tx_state_update — clears dedup on COMPLETE", test_apply_tx_state_update_clears_dedup_on_complete)
     run("48. _apply_tx_state_update — dedup preserved on ERROR", test_apply_tx_state_update_does_not_clear_dedup_on_error)
     run("49. _switch_to_voice — stops active CQ session",   test_switch_to_voice_stops_active_cq_session)
     run("50. _switch_to_voice — no-op when session off",    test_switch_to_voice_skips_stop_session_when_inactive)
     run("51. _maybe_assist_prefill — RRR hint text",        test_maybe_assist_prefill_rrr_completion_hint)
     run("52. _maybe_assist_prefill — RR73 hint text",       test_maybe_assist_prefill_rr73_completion_hint)
+    run("52b. COMPLETE — schedules CQ retry (auto-arm on)", test_apply_tx_state_complete_schedules_cq_retry_when_auto_arm_on)
+    run("52c. COMPLETE — no CQ retry (auto-arm off)",       test_apply_tx_state_complete_no_cq_retry_when_auto_arm_off)
+    run("52d. CANCELED — cancels CQ retry",                 test_apply_tx_state_canceled_cancels_retry)
+    run("52e. _check_and_rearm_cq — re-arms on CQ_SENT",    test_check_and_rearm_cq_rearms_when_still_cq_sent)
+    run("52f. _check_and_rearm_cq — skips after reply",     test_check_and_rearm_cq_skips_when_dx_replied)
+    run("52g. _maybe_assist_prefill — reply cancels retry", test_maybe_assist_prefill_cancels_cq_retry_on_response)
+    run("53. connect readback — worker posts to queue",      test_connect_readback_worker_posts_to_ui_queue)
+    run("54. connect readback — sets band + controls",       test_apply_connect_readback_sets_band_and_controls)
+    run("55. radio_poll_thread — one batched query",         test_radio_poll_thread_batches_full_poll_in_one_query)
+    run("56. apply_rf_power — uses setter result",           test_apply_rf_power_uses_setter_result_without_readback)
+    run("56b. apply_rf_power — failed write shows error",    test_apply_rf_power_failed_write_shows_error_not_set)
+    run("57. APPLY handlers — no CAT I/O on Tk thread",      test_apply_handlers_do_no_cat_io_on_tk_thread)
+    run("58. apply_mode — requests slow poll",               test_apply_mode_requests_immediate_slow_poll)
+    run("59. APPLY handlers — accept Tk event",              test_apply_handlers_accept_tk_event_when_bound_directly)
+    run("60. radio_poll_thread — slow refresh request",      test_radio_poll_thread_honours_slow_refresh_request)
+    run("61. radio_poll_thread — only changed readouts",     test_radio_poll_thread_queues_only_changed_readouts)
+    run("62. refresh_connection_ui — forces next sample",    test_refresh_connection_ui_forces_next_poll_sample_through)
+    run("63. radio_poll_thread — sleeps on shutdown",        test_radio_poll_thread_sleeps_on_shutdown_until_next_deadline)
+    run("64. process_ui_queue — focused controls skipped",   test_process_ui_queue_skips_focused_controls_without_focus_get)
+    run("65. process_ui_queue — unfocused controls set",     test_process_ui_queue_updates_unfocused_controls)
+    run("66. log_to_file — one writer thread",               test_log_to_file_writes_rows_on_one_writer_thread)
+    run("67. _radio_log_writer — one flush per burst",       test_radio_log_writer_flushes_a_queued_burst_once)
+    run("68. log_box — scan lines coalesce",                 test_scan_log_lines_coalesce_into_one_insert)
+    run("69. STOP SCAN — interrupts dwell",                  test_stop_scan_interrupts_dwell_immediately)
+    run("70. scan_thread — stale thread leaves flags",       test_stale_scan_thread_leaves_new_scan_flags_alone)
+    run("71. squelch validator — 0..255 only",               test_squelch_validator_accepts_only_0_to_255)
+    run("72. squelch change — published to scan",            test_squelch_change_is_published_to_scan_thread)
+    run("73. scan_thread — live squelch each step",          test_scan_thread_reads_live_squelch_each_step)
+    run("74. scan_thread — integer-Hz grid wraps",           test_scan_thread_steps_integer_hz_grid_and_wraps)
+    run("75. log_to_file — timestamp once per second",       test_log_to_file_formats_timestamp_once_per_second)
+    run("76. scan dwell — releases on signal drop",          test_scan_dwell_releases_when_signal_drops)
+    run("77. process_ui_queue — unchanged readouts",         test_process_ui_queue_skips_unchanged_readouts)
+    run("78. scan_thread — no retune same channel",          test_scan_thread_does_not_retune_unchanged_channel)
+    run("79. log_to_file — frequency formatted once",        test_log_to_file_formats_frequency_once_for_csv_and_log_box)
+    run("80. toggle_scan — stop restores button",            test_toggle_scan_stop_restores_start_button)
+    run("81. process_ui_queue — coalesce keeps order",       test_process_ui_queue_coalesces_readouts_keeping_event_order)
+    run("81b. process_ui_queue — newest status per widget",  test_process_ui_queue_coalesces_per_widget_so_newest_status_wins)
+    run("82. goto_band — one verified write",                test_goto_band_sets_mode_and_frequency_in_one_verified_write)
+    run("83. goto_band — retries off readback",              test_goto_band_retries_frequency_when_readback_is_off)
+    run("84. goto_band — unknown band ignored",              test_goto_band_ignores_unknown_band)
+    run("85. _ptt_allowed — enabled flag, no Tcl",           test_ptt_allowed_uses_enabled_flag_without_tcl)
+    run("86. PTT disabled — press does not key",             test_disabled_ptt_state_blocks_press_without_keying)
+    run("87. _WakeQueue — one wake per burst",               test_ui_queue_wakes_tk_once_per_burst)
+    run("88. _WakeQueue — sheds superseded readouts",        test_ui_queue_sheds_superseded_readouts_when_stalled)
+    run("89. _WakeQueue — keeps ordered events",             test_ui_queue_never_drops_ordered_events)
+    run("89b. _WakeQueue — compacts per widget",             test_ui_queue_compacts_per_widget_keeping_newest_status)
+    run("90. _WakeQueue.put — never calls into Tk",          test_ui_queue_put_never_calls_into_tk)
+    run("91. _ui_wake_thread — forwards, exits",             test_ui_wake_thread_forwards_one_event_and_exits_on_shutdown)
+    run("92. failed wake — fast polling fallback",           test_failed_wake_falls_back_to_fast_polling)
+    run("93. UI polling — idle back-off",                    test_ui_polling_backs_off_while_idle_and_snaps_back)
 
     passed = sum(1 for _, ok, _ in results if ok)
     total  = len(results)
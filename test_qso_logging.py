@@ -51,6 +51,7 @@ Run:  pytest test_qso_logging.py -v
 """
 from __future__ import annotations
 
+import collections
 import os
 import sys
 import tempfile
@@ -185,8 +186,9 @@ def _make_gui(main_mod, adif_path: str):
     fake_root.after.return_value = "after_handle"
     fake_root.focus_get.return_value = None
 
-    # Patch ADIF_LOG_PATH to temp file
+    # Patch ADIF_LOG_PATH and the legacy CSV log to temp files
     main_mod.ADIF_LOG_PATH = adif_path
+    main_mod.RADIO_LOG_PATH = os.path.splitext(adif_path)[0] + ".csv"
 
     gui = main_mod.RadioGUI.__new__(main_mod.RadioGUI)
     # Minimal bootstrap — only the attributes we test against
@@ -229,6 +231,7 @@ def _make_gui(main_mod, adif_path: str):
     gui._auto_arm_var.get.return_value = False
     gui._cq_retry_after = None
     gui._current_freq     = 14.074
+    gui._current_s_meter  = 0
     gui._current_mode     = "USB"
     gui._current_rf_power = 10
 
@@ -245,6 +248,13 @@ def _make_gui(main_mod, adif_path: str):
     gui._cq_session_btn    = mock.MagicMock()
     gui._stop_session_btn  = mock.MagicMock()
     gui.log_box            = mock.MagicMock()
+    gui._log_pending       = collections.deque(maxlen=main_mod.RadioGUI._LOG_MAX_LINES)
+    gui._log_flush_scheduled = False
+    gui._log_q             = __import__("queue").Queue()
+    gui._log_thread        = None
+    gui._log_lock          = threading.Lock()
+    gui._last_ts_sec       = 0
+    gui._last_ts_str       = ""
     gui.ft8_log            = mock.MagicMock()
 
     # Voice QSO form vars
@@ -652,7 +662,8 @@ class TestVoiceQsoLogForm(unittest.TestCase):
         self.gui, self.cfg_path = _make_gui(self.main, self.adif_path)
 
     def tearDown(self):
-        for p in (self.adif_path, self.cfg_path):
+        self.gui._close_radio_log()
+        for p in (self.adif_path, self.cfg_path, self.main.RADIO_LOG_PATH):
             if os.path.exists(p):
                 os.unlink(p)
 
@@ -707,6 +718,27 @@ class TestVoiceQsoLogForm(unittest.TestCase):
         self.gui._on_log_voice_qso()
         self.gui.log_box.insert.assert_called()
 
+    def test_log_voice_qso_csv_row_goes_to_temp_log(self):
+        self.gui._on_log_voice_qso()
+        self.gui._close_radio_log()
+        with open(self.main.RADIO_LOG_PATH, newline="") as fh:
+            rows = fh.read().splitlines()
+        self.assertEqual(len(rows), 1)
+        self.assertTrue(rows[0].endswith(",14.0740,0,QSO K9XYZ"), rows)
+
+    def test_log_voice_qso_uses_polled_s_meter_without_cat_io(self):
+        self.gui._current_s_meter = 87
+        with mock.patch.object(self.gui, "log_to_file") as m_log:
+            self.gui._on_log_voice_qso()
+        m_log.assert_called_once_with(14.074, 87, "QSO K9XYZ")
+        self.gui.radio.get_s_meter.assert_not_called()
+
+    def test_log_voice_qso_log_box_line_is_trimmed(self):
+        self.gui._on_log_voice_qso()
+        text = self.gui.log_box.insert.call_args[0][1]
+        self.assertIn("[Voice QSO] K9XYZ", text)
+        self.gui.log_box.delete.assert_called_with("1.0", "end-501l")
+
 
 # =============================================================================
 # Group D — FT8 auto-logging